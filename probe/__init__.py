@@ -9,13 +9,19 @@ Usage:
         properties=["consistency"],
     )
     print_summary(results)
+
+    # Many suites back-to-back with warm clients and models:
+    with ProbeSession() as session:
+        a = session.run("ollama:llama3", inputs, ["consistency"])
+        b = session.run("ollama:llama3", more_inputs, ["robustness"])
 """
 
 __version__ = "0.1.0"
 
 from probe.core.models import ProbeResult, SuiteResult, Verdict
 from probe.core.runner import run_suite_sync
-from probe.core.reporter import print_summary, export_json
+from probe.core.session import ProbeSession
+from probe.core.reporter import print_summary, export_json, export_html
 from probe.providers import get_provider
 from probe.properties import get_property, PROPERTY_REGISTRY
 
@@ -26,13 +32,15 @@ def quick_test(
     properties: list[str] | None = None,
     threshold: float = 0.8,
     concurrency: int = 5,
+    weights: list[float] | None = None,
+    baseline: str | None = None,
 ) -> SuiteResult:
-    """One-liner to run behavioral tests."""
-    if properties is None:
-        properties = ["consistency"]
-    provider = get_provider(model)
-    props = [get_property(name, threshold=threshold) for name in properties]
-    return run_suite_sync(provider, inputs, props, concurrency=concurrency)
+    """One-liner to run behavioral tests. Use a ``ProbeSession`` to run many suites warm.
+
+    ``baseline`` is the directory written by ``probe baseline save``, for the drift property.
+    """
+    with ProbeSession(concurrency=concurrency, threshold=threshold) as session:
+        return session.run(model, inputs, properties, weights=weights, baseline=baseline)
 
 
 def compare_models(
@@ -43,11 +51,5 @@ def compare_models(
     threshold: float = 0.8,
 ) -> tuple[SuiteResult, SuiteResult]:
     """Compare two models on the same behavioral tests."""
-    if properties is None:
-        properties = ["consistency"]
-    prov_a, prov_b = get_provider(model_a), get_provider(model_b)
-    props_a = [get_property(name, threshold=threshold) for name in properties]
-    props_b = [get_property(name, threshold=threshold) for name in properties]
-    sa = run_suite_sync(prov_a, inputs, props_a)
-    sb = run_suite_sync(prov_b, inputs, props_b)
-    return sa, sb
+    with ProbeSession(threshold=threshold) as session:
+        return session.compare(model_a, model_b, inputs, properties)
@@ -2,31 +2,40 @@ import asyncio
 import json
 import sys
 import click
+import numpy as np
 from rich.console import Console
 
 console = Console()
 
 
-def _load_inputs(inputs, input_text):
+def _load_weighted_inputs(inputs, input_text):
     if input_text:
-        return [input_text]
+        return [input_text], [1.0]
     if inputs:
-        items = []
+        items, weights = [], []
         with open(inputs, "r") as f:
             for line in f:
                 line = line.strip()
                 if not line or line.startswith("#"):
                     continue
+                weight = 1.0
                 try:
                     obj = json.loads(line)
+                    if isinstance(obj, dict):
+                        weight = float(obj.get("weight", 1.0))
                     items.append(obj if isinstance(obj, str) else obj.get("input", obj.get("text", str(obj))))
                 except json.JSONDecodeError:
                     items.append(line)
-        return items
+                weights.append(weight)
+        return items, weights
     console.print("[red]Error: Provide --inputs <file> or --input <text>[/red]")
     sys.exit(1)
 
 
+def _load_inputs(inputs, input_text):
+    return _load_weighted_inputs(inputs, input_text)[0]
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="probe")
 def cli():
@@ -41,33 +50,77 @@ def cli():
 @click.option("--properties", "-p", default="consistency", help="Comma-separated properties")
 @click.option("--threshold", "-t", default=0.8, type=float, help="Pass threshold (0-1)")
 @click.option("--concurrency", "-c", default=5, type=int, help="Max concurrent API calls")
-@click.option("--output", "-o", default=None, help="Export results to JSON file")
-def run(model, inputs, input_text, properties, threshold, concurrency, output):
+@click.option("--output", "-o", default=None,
+              help="Export results to JSON, or .parquet/.arrow for a lossless columnar export")
+@click.option("--retain", default="all", type=click.Choice(["all", "failures", "none"]),
+              help="Which results keep their output texts in memory")
+@click.option("--spill-dir", default=None, help="Spill result texts to a file in this directory")
+@click.option("--report", "report_mode", default="auto",
+              type=click.Choice(["auto", "full", "aggregate"]), help="Terminal report style")
+@click.option("--top-k", default=10, type=int, help="Failures shown in the aggregate report")
+@click.option("--html", "html_path", default=None, help="Write an HTML report to this path")
+@click.option("--pack-size", default=1, type=int,
+              help="Pack this many inputs into one transform-generation request")
+@click.option("--deadline", default=None, type=float, help="Per-call deadline in seconds")
+@click.option("--hedge", is_flag=True, help="Duplicate calls slower than the observed p95 latency")
+@click.option("--baseline", default=None, help="Baseline directory for the drift property")
+def run(model, inputs, input_text, properties, threshold, concurrency, output, retain, spill_dir,
+        report_mode, top_k, html_path, pack_size, deadline, hedge, baseline):
     """Run behavioral property tests on an LLM."""
     from probe.providers import get_provider
-    from probe.properties import get_property
+    from probe.properties import get_property, PROPERTY_REGISTRY
     from probe.core.runner import run_suite_sync
-    from probe.core.reporter import print_summary, export_json
+    from probe.core.reporter import print_summary, export_json, export_html
 
     console.print(f"\n[bold cyan]Probe[/bold cyan] [dim]v0.1.0[/dim]")
     console.print(f"  Model: [bold]{model}[/bold]")
 
-    input_list = _load_inputs(inputs, input_text)
+    input_list, weights = _load_weighted_inputs(inputs, input_text)
     console.print(f"  Inputs: [bold]{len(input_list)}[/bold] test cases")
+    if any(w != 1.0 for w in weights):
+        console.print(f"  Weighted: [bold]{sum(weights):.0f}[/bold] represented inputs")
 
     prop_names = [p.strip() for p in properties.split(",")]
-    props = [get_property(name, threshold=threshold) for name in prop_names]
+    props = []
+    for name in prop_names:
+        cls = PROPERTY_REGISTRY.get(name.lower())
+        extra = {}
+        if pack_size > 1 and getattr(cls, "packable", False):
+            extra["pack_size"] = pack_size
+        if getattr(cls, "uses_baseline", False):
+            if not baseline:
+                console.print(f"[red]Error: {name} needs --baseline <dir> "
+                              f"(create one with probe baseline save)[/red]")
+                sys.exit(1)
+            extra["baseline"] = baseline
+        props.append(get_property(name, threshold=threshold, **extra))
     console.print(f"  Properties: [bold]{', '.join(prop_names)}[/bold]")
     console.print(f"  Threshold: [bold]{threshold}[/bold]\n")
 
     provider = get_provider(model)
+    if deadline is not None or hedge:
+        from probe.providers import HedgedProvider
+        provider = HedgedProvider(provider, deadline=deadline, hedge=hedge)
+
+    try:
+        with console.status("[bold green]Running behavioral tests..."):
+            suite = run_suite_sync(provider, input_list, props, concurrency=concurrency,
+                                   retain=retain, spill_dir=spill_dir, weights=weights)
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
 
-    with console.status("[bold green]Running behavioral tests..."):
-        suite = run_suite_sync(provider, input_list, props, concurrency=concurrency)
-
-    print_summary(suite)
-    if output:
-        export_json(suite, output)
+    with suite:
+        print_summary(suite, mode=report_mode, top_k=top_k)
+        if html_path:
+            export_html(suite, html_path)
+        if output:
+            from probe.core.columnar import is_columnar_path, export_columnar
+            if is_columnar_path(output):
+                export_columnar(suite, output)
+                console.print(f"[dim]Results exported to {output}[/dim]")
+            else:
+                export_json(suite, output)
     if suite.failed > 0 or suite.errors > 0:
         sys.exit(1)
 
@@ -80,24 +133,22 @@ def run(model, inputs, input_text, properties, threshold, concurrency, output):
 @click.option("--threshold", "-t", default=0.8, type=float)
 def compare(model_a, model_b, inputs, properties, threshold):
     """Compare behavioral properties of two models side-by-side."""
-    from probe.providers import get_provider
-    from probe.properties import get_property
-    from probe.core.runner import run_suite_sync
+    from probe.core.session import ProbeSession
+    from probe.core.reporter import property_aggregates
     from rich.table import Table
 
     console.print(f"\n[bold cyan]Probe Compare[/bold cyan]")
     console.print(f"  Model A: [bold]{model_a}[/bold]")
     console.print(f"  Model B: [bold]{model_b}[/bold]\n")
 
-    input_list = _load_inputs(inputs, None)
+    input_list, weights = _load_weighted_inputs(inputs, None)
     prop_names = [p.strip() for p in properties.split(",")]
 
-    with console.status("[bold green]Testing Model A..."):
-        sa = run_suite_sync(get_provider(model_a), input_list,
-                            [get_property(n, threshold=threshold) for n in prop_names])
-    with console.status("[bold green]Testing Model B..."):
-        sb = run_suite_sync(get_provider(model_b), input_list,
-                            [get_property(n, threshold=threshold) for n in prop_names])
+    with ProbeSession(threshold=threshold) as session:
+        with console.status("[bold green]Testing Model A..."):
+            sa = session.run(model_a, input_list, prop_names, weights=weights)
+        with console.status("[bold green]Testing Model B..."):
+            sb = session.run(model_b, input_list, prop_names, weights=weights)
 
     tbl = Table(title="Model Comparison", show_header=True, header_style="bold")
     tbl.add_column("Property", style="cyan")
@@ -105,11 +156,12 @@ def compare(model_a, model_b, inputs, properties, threshold):
     tbl.add_column(model_b, justify="center")
     tbl.add_column("Winner", justify="center")
 
+    # Mean scores weighted by input weight (cluster size for a minimized inputs file).
+    means_a = {a["property"]: a["mean_score"] for a in property_aggregates(sa)}
+    means_b = {a["property"]: a["mean_score"] for a in property_aggregates(sb)}
     for pn in prop_names:
-        aa = [r.score for r in sa.results if r.property_name == pn]
-        bb = [r.score for r in sb.results if r.property_name == pn]
-        ma = sum(aa) / len(aa) if aa else 0
-        mb = sum(bb) / len(bb) if bb else 0
+        ma = means_a.get(pn, 0)
+        mb = means_b.get(pn, 0)
         ca = "green" if ma >= threshold else "red"
         cb = "green" if mb >= threshold else "red"
         w = "[bold green]<- A[/bold green]" if ma > mb + 0.02 else "[bold green]B ->[/bold green]" if mb > ma + 0.02 else "[dim]Tie[/dim]"
@@ -122,6 +174,145 @@ def compare(model_a, model_b, inputs, properties, threshold):
     console.print(tbl)
 
 
+@cli.command()
+@click.argument("run_path")
+@click.option("--page", default=None, type=int, help="Show this page of the per-result table")
+@click.option("--page-size", default=50, type=int)
+@click.option("--top-k", default=10, type=int, help="Failures shown in the aggregate report")
+@click.option("--html", "html_path", default=None, help="Write an HTML report to this path")
+def report(run_path, page, page_size, top_k, html_path):
+    """Report on a saved columnar run (.parquet/.arrow)."""
+    from probe.core.columnar import load_columnar
+    from probe.core.reporter import print_aggregate, print_page, export_html
+
+    suite = load_columnar(run_path, retain="failures")
+    if page is not None:
+        print_page(suite, page=page, page_size=page_size)
+    else:
+        print_aggregate(suite, top_k=top_k)
+    if html_path:
+        export_html(suite, html_path)
+
+
+@cli.command()
+@click.argument("run_a")
+@click.argument("run_b")
+@click.option("--top", "-k", default=10, type=int, help="Show the K largest score drops")
+def diff(run_a, run_b, top):
+    """Compare two columnar runs (.parquet/.arrow) by input and property."""
+    from probe.core.columnar import diff_runs, read_table
+    from rich.table import Table
+
+    d = diff_runs(run_a, run_b)
+    console.print("\n[bold cyan]Probe Diff[/bold cyan]")
+    console.print(f"  A: [bold]{run_a}[/bold]")
+    console.print(f"  B: [bold]{run_b}[/bold]")
+    console.print(
+        f"  Matched: [bold]{d.matched}[/bold]  "
+        f"Regressions: [red]{int(d.regressions.sum())}[/red]  "
+        f"Fixes: [green]{int(d.fixes.sum())}[/green]  "
+        f"Only in A: [dim]{d.only_in_a}[/dim]  Only in B: [dim]{d.only_in_b}[/dim]\n"
+    )
+
+    tbl = Table(show_header=True, header_style="bold")
+    tbl.add_column("Property", style="cyan")
+    tbl.add_column("Matched", justify="right")
+    tbl.add_column("Regressions", justify="right")
+    tbl.add_column("Fixes", justify="right")
+    tbl.add_column("Mean Δ score", justify="right")
+    for row in d.by_property():
+        c = "green" if row["mean_delta"] >= 0 else "red"
+        tbl.add_row(row["property"], str(row["matched"]), f"[red]{row['regressions']}[/red]",
+                    f"[green]{row['fixes']}[/green]", f"[{c}]{row['mean_delta']:+.3f}[/{c}]")
+    console.print(tbl)
+
+    worst = d.worst(top)
+    worst = worst[d.delta[worst] < 0]
+    if len(worst):
+        column = read_table(run_a, columns=["input"]).column("input")
+        inputs = column.take(d.row_a[worst]).to_pylist()
+        console.print(f"\n[bold red]-- Largest Score Drops ({len(worst)}) --[/bold red]\n")
+        for i, text in zip(worst, inputs):
+            flag = " [red]REGRESSION[/red]" if d.regressions[i] else ""
+            console.print(f"  [bold]{d.property_names[d.property_id[i]]}[/bold] "
+                          f"{d.score_a[i]:.3f} -> {d.score_b[i]:.3f}{flag}  {text[:60]}")
+    console.print()
+    if d.regressions.any():
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--inputs", "-i", required=True, help="Path to inputs file (.jsonl/.txt)")
+@click.option("--output", "-o", required=True, help="Where to write the reduced .jsonl set")
+@click.option("--threshold", "-t", default=0.9, type=float,
+              help="Cosine similarity at which inputs count as near-duplicates")
+@click.option("--block-size", default=4096, type=int, help="Rows per similarity block")
+def minimize(inputs, output, threshold, block_size):
+    """Cluster near-duplicate inputs and keep one weighted representative per cluster."""
+    from probe.core.minimize import minimize_inputs
+
+    items, weights = _load_weighted_inputs(inputs, None)
+    with console.status("[bold green]Embedding and clustering inputs..."):
+        reps, sizes, clustering = minimize_inputs(items, threshold=threshold, block_size=block_size)
+    # Inputs that already carry weights (a previously minimized file) keep their mass.
+    mass = np.bincount(clustering.labels, weights=weights, minlength=len(reps))
+
+    with open(output, "w") as f:
+        for text, size, w in zip(reps, sizes, mass.tolist()):
+            f.write(json.dumps({"input": text, "weight": w, "cluster_size": size}) + "\n")
+
+    console.print(f"\n[bold green]✅ {len(items)} inputs -> {len(reps)} "
+                  f"representatives[/bold green] "
+                  f"[dim]({len(items) / max(len(reps), 1):.1f}x reduction)[/dim]")
+    console.print(f"   Written to [bold]{output}[/bold]\n")
+
+
+@cli.group()
+def baseline():
+    """Manage approved-output baselines for the drift property."""
+    pass
+
+
+@baseline.command("save")
+@click.option("--model", "-m", required=True, help="e.g. openai:gpt-4o-mini")
+@click.option("--inputs", "-i", required=True, help="Path to inputs file (.jsonl/.txt)")
+@click.option("--output", "-o", required=True, help="Baseline directory to write")
+@click.option("--concurrency", "-c", default=5, type=int, help="Max concurrent API calls")
+def baseline_save(model, inputs, output, concurrency):
+    """Store each input's answer and its embedding as the approved baseline."""
+    from probe.core.baseline import build_baseline
+    from probe.providers import get_provider
+
+    input_list = _load_inputs(inputs, None)
+    provider = get_provider(model)
+
+    async def main():
+        try:
+            return await build_baseline(provider, input_list, concurrency=concurrency)
+        finally:
+            await provider.aclose()
+
+    try:
+        with console.status(f"[bold green]Answering {len(input_list)} inputs..."):
+            base, missing = asyncio.run(main())
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+    base.save(output)
+    console.print(f"\n[bold green]✅ Baseline of {len(base)} answers saved to "
+                  f"'{output}'[/bold green]")
+    if missing:
+        console.print(f"[yellow]   {len(missing)} inputs failed and are not in the "
+                      f"baseline:[/yellow]")
+        for text in missing[:10]:
+            console.print(f"   [dim]- {text[:80]}[/dim]")
+        if len(missing) > 10:
+            console.print(f"   [dim]... and {len(missing) - 10} more[/dim]")
+    console.print("   Check drift with:\n")
+    console.print(f"   [bold]probe run --model <new-model> --inputs {inputs} "
+                  f"-p drift --baseline {output}[/bold]\n")
+
+
 @cli.command("list-properties")
 def list_properties():
     """List all available behavioral properties."""
@@ -0,0 +1,99 @@
+from __future__ import annotations
+import asyncio
+import json
+import os
+
+import numpy as np
+
+from probe.core.hashing import input_hash
+
+
+class Baseline:
+    """Approved outputs and their embeddings, keyed by input hash.
+
+    Stored as a directory: ``index.npy`` (sorted uint64 input hashes), ``embeddings.npy``
+    (float16, one row per input, memory-mapped on load), ``outputs.jsonl`` and ``meta.json``.
+    """
+
+    def __init__(self, hashes: np.ndarray, embeddings: np.ndarray, outputs: list[str],
+                 meta: dict | None = None):
+        self.hashes = hashes
+        self.embeddings = embeddings
+        self.outputs = outputs
+        self.meta = meta or {}
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @classmethod
+    def build(cls, inputs: list[str], outputs: list[str], embeddings: np.ndarray,
+              meta: dict | None = None) -> "Baseline":
+        hashes = np.array([input_hash(t) for t in inputs], dtype=np.uint64)
+        hashes, first = np.unique(hashes, return_index=True)
+        return cls(hashes, np.asarray(embeddings, dtype=np.float16)[first],
+                   [outputs[i] for i in first], meta)
+
+    def save(self, path: str) -> None:
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "index.npy"), self.hashes)
+        np.save(os.path.join(path, "embeddings.npy"), self.embeddings)
+        with open(os.path.join(path, "outputs.jsonl"), "w") as f:
+            for h, out in zip(self.hashes.tolist(), self.outputs):
+                f.write(json.dumps({"hash": h, "output": out}) + "\n")
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({**self.meta, "count": len(self)}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "Baseline":
+        hashes = np.load(os.path.join(path, "index.npy"))
+        embeddings = np.load(os.path.join(path, "embeddings.npy"), mmap_mode="r")
+        with open(os.path.join(path, "outputs.jsonl")) as f:
+            outputs = [json.loads(line)["output"] for line in f]
+        meta_path = os.path.join(path, "meta.json")
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+        return cls(hashes, embeddings, outputs, meta)
+
+    def rows(self, texts: list[str]) -> np.ndarray:
+        """Baseline row for each input text, or -1 where the input has no baseline."""
+        keys = np.array([input_hash(t) for t in texts], dtype=np.uint64)
+        idx = np.searchsorted(self.hashes, keys)
+        idx = np.minimum(idx, max(len(self.hashes) - 1, 0))
+        found = (self.hashes[idx] == keys) if len(self.hashes) else np.zeros(len(keys), bool)
+        return np.where(found, idx, -1)
+
+    def similarity(self, rows: np.ndarray, embs: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each new embedding with its baseline row, in one operation."""
+        base = np.asarray(self.embeddings[rows], dtype=np.float32)
+        return np.clip(np.einsum("ij,ij->i", base, np.asarray(embs, dtype=np.float32)), 0.0, 1.0)
+
+
+async def build_baseline(provider, inputs: list[str], comparator=None,
+                         concurrency: int = 5) -> tuple[Baseline, list[str]]:
+    """Generate each input's answer with ``provider`` and embed all answers in one pass.
+
+    Returns the baseline of every input that was answered, and the inputs that failed.
+    """
+    from probe.core.comparators import EmbeddingSimilarity
+    comp = comparator or EmbeddingSimilarity()
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(text: str) -> str:
+        async with sem:
+            return await provider.generate(text)
+
+    await provider.warmup()
+    answers = await asyncio.gather(*[one(t) for t in inputs], return_exceptions=True)
+    kept = [(t, a) for t, a in zip(inputs, answers) if not isinstance(a, BaseException)]
+    missing = [t for t, a in zip(inputs, answers) if isinstance(a, BaseException)]
+    if not kept:
+        first = next((a for a in answers if isinstance(a, BaseException)), "no inputs")
+        raise RuntimeError(f"No input was answered (first error: {first})")
+    outputs = [a for _, a in kept]
+    base = Baseline.build([t for t, _ in kept], outputs, comp.encode(outputs),
+                          meta={"model": provider.model_name,
+                                "embedding_model": getattr(comp, "_model_name", None),
+                                "missing": len(missing)})
+    return base, missing
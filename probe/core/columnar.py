@@ -0,0 +1,211 @@
+from __future__ import annotations
+import json
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from probe.core.hashing import input_hash
+from probe.core.models import ProbeResult, SuiteResult, Verdict
+from probe.core.store import ResultStore, VERDICTS, PASS
+
+BATCH_ROWS = 65536
+COLUMNAR_SUFFIXES = (".parquet", ".arrow", ".feather", ".ipc")
+
+
+def _pa():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError("Install pyarrow: pip install probe-llm[arrow]")
+    return pyarrow
+
+
+def is_columnar_path(path: str) -> bool:
+    return path.lower().endswith(COLUMNAR_SUFFIXES)
+
+
+def _schema(pa):
+    return pa.schema([
+        ("input_hash", pa.uint64()),
+        ("input", pa.large_string()),
+        ("property", pa.dictionary(pa.int32(), pa.string())),
+        ("verdict", pa.dictionary(pa.int8(), pa.string())),
+        ("score", pa.float64()),
+        ("elapsed_ms", pa.float64()),
+        ("weight", pa.float64()),
+        ("original_output", pa.large_string()),
+        ("variant_outputs", pa.large_list(pa.large_string())),
+        ("details", pa.large_string()),
+    ])
+
+
+def _batches(suite: SuiteResult, pa, schema):
+    store = suite.store
+    order = store.order()
+    hashes: dict[int, int] = {}
+    property_dict = pa.array(store.property_names, type=pa.string())
+    verdict_dict = pa.array([v.value for v in VERDICTS], type=pa.string())
+
+    for lo in range(0, len(order), BATCH_ROWS):
+        rows = order[lo:lo + BATCH_ROWS]
+        views = [store.row(int(r)) for r in rows]
+        input_ids = store.input_ids[rows]
+        for iid, r in zip(input_ids.tolist(), views):
+            if iid not in hashes:
+                hashes[iid] = input_hash(r.input)
+        yield pa.RecordBatch.from_arrays([
+            pa.array([hashes[i] for i in input_ids.tolist()], type=pa.uint64()),
+            pa.array([r.input for r in views], type=pa.large_string()),
+            pa.DictionaryArray.from_arrays(pa.array(store.property_ids[rows]), property_dict),
+            pa.DictionaryArray.from_arrays(pa.array(store.verdict_codes[rows]), verdict_dict),
+            pa.array(store.scores[rows], type=pa.float64()),
+            pa.array(store.elapsed_ms[rows], type=pa.float64()),
+            pa.array(store.weights[rows], type=pa.float64()),
+            pa.array([r.original_output for r in views], type=pa.large_string()),
+            pa.array([r.variant_outputs for r in views], type=pa.large_list(pa.large_string())),
+            pa.array([json.dumps(r.details, default=str) for r in views], type=pa.large_string()),
+        ], schema=schema)
+
+
+def export_columnar(suite: SuiteResult, path: str) -> None:
+    """Write full results to Parquet (``.parquet``) or Arrow IPC (``.arrow``/``.feather``)."""
+    pa = _pa()
+    schema = _schema(pa).with_metadata({
+        "model": suite.model_name,
+        "total_elapsed_ms": str(suite.total_elapsed_ms),
+    })
+    if path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in _batches(suite, pa, schema):
+                writer.write_batch(batch)
+    else:
+        with pa.ipc.new_file(path, schema) as writer:
+            for batch in _batches(suite, pa, schema):
+                writer.write_batch(batch)
+
+
+def read_table(path: str, columns: list[str] | None = None):
+    pa = _pa()
+    if path.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        return pq.read_table(path, columns=columns)
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
+
+
+def load_columnar(path: str, retain: str = "all") -> SuiteResult:
+    """Load a run written by ``export_columnar`` back into a ``SuiteResult``."""
+    table = read_table(path)
+    meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+    store = ResultStore(retain=retain)
+    cols = table.to_pydict()
+    weights = cols.get("weight") or [1.0] * table.num_rows
+    for i in range(table.num_rows):
+        store.append(ProbeResult(
+            input=cols["input"][i],
+            property_name=cols["property"][i],
+            verdict=Verdict(cols["verdict"][i]),
+            score=cols["score"][i],
+            details=json.loads(cols["details"][i] or "{}"),
+            original_output=cols["original_output"][i] or "",
+            variant_outputs=cols["variant_outputs"][i] or [],
+            elapsed_ms=cols["elapsed_ms"][i],
+        ), weight=weights[i])
+    return SuiteResult(
+        model_name=meta.get("model", ""),
+        total_elapsed_ms=float(meta.get("total_elapsed_ms", 0.0)),
+        store=store,
+    )
+
+
+def _key_columns(path: str, properties: dict[str, int]):
+    table = read_table(path, columns=["input_hash", "property", "verdict", "score"])
+    prop = table.column("property").combine_chunks().cast("string").to_numpy(zero_copy_only=False)
+    names, inverse = np.unique(prop.astype(str), return_inverse=True)
+    pids = np.array([properties.setdefault(str(n), len(properties)) for n in names], dtype=np.int32)
+    keys = np.empty(table.num_rows, dtype=[("hash", np.uint64), ("pid", np.int32)])
+    keys["hash"] = table.column("input_hash").to_numpy()
+    keys["pid"] = pids[inverse] if len(names) else 0
+    verdict = table.column("verdict").combine_chunks().cast("string").to_numpy(zero_copy_only=False)
+    passed = verdict.astype(str) == VERDICTS[PASS].value
+    return keys, passed, table.column("score").to_numpy()
+
+
+@dataclass
+class RunDiff:
+    """Join of two runs on (input hash, property)."""
+
+    property_names: list[str]
+    input_hash: np.ndarray
+    property_id: np.ndarray
+    score_a: np.ndarray
+    score_b: np.ndarray
+    passed_a: np.ndarray
+    passed_b: np.ndarray
+    only_in_a: int = 0
+    only_in_b: int = 0
+    row_a: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+
+    @property
+    def matched(self) -> int:
+        return len(self.input_hash)
+
+    @property
+    def delta(self) -> np.ndarray:
+        return self.score_b - self.score_a
+
+    @property
+    def regressions(self) -> np.ndarray:
+        return self.passed_a & ~self.passed_b
+
+    @property
+    def fixes(self) -> np.ndarray:
+        return ~self.passed_a & self.passed_b
+
+    def by_property(self) -> list[dict]:
+        out = []
+        for pid, name in enumerate(self.property_names):
+            mask = self.property_id == pid
+            if not mask.any():
+                continue
+            out.append({
+                "property": name,
+                "matched": int(mask.sum()),
+                "regressions": int(self.regressions[mask].sum()),
+                "fixes": int(self.fixes[mask].sum()),
+                "mean_delta": float(self.delta[mask].mean()),
+            })
+        return out
+
+    def worst(self, k: int = 10) -> np.ndarray:
+        """Indices of the ``k`` largest score drops, most negative first."""
+        d = self.delta
+        k = min(k, len(d))
+        if k == 0:
+            return np.empty(0, dtype=np.int64)
+        idx = np.argpartition(d, k - 1)[:k]
+        return idx[np.argsort(d[idx], kind="stable")]
+
+
+def diff_runs(path_a: str, path_b: str) -> RunDiff:
+    """Vectorized join of two columnar runs by (input hash, property)."""
+    properties: dict[str, int] = {}
+    keys_a, passed_a, score_a = _key_columns(path_a, properties)
+    keys_b, passed_b, score_b = _key_columns(path_b, properties)
+    common, ia, ib = np.intersect1d(keys_a, keys_b, return_indices=True)
+    names = [n for n, _ in sorted(properties.items(), key=lambda kv: kv[1])]
+    return RunDiff(
+        property_names=names,
+        input_hash=common["hash"],
+        property_id=common["pid"],
+        score_a=score_a[ia],
+        score_b=score_b[ib],
+        passed_a=passed_a[ia],
+        passed_b=passed_b[ib],
+        only_in_a=len(np.unique(keys_a)) - len(common),
+        only_in_b=len(np.unique(keys_b)) - len(common),
+        row_a=ia.astype(np.int64),
+    )
@@ -22,6 +22,12 @@ class EmbeddingSimilarity(Comparator):
             from sentence_transformers import SentenceTransformer
             self._model = SentenceTransformer(self._model_name)
 
+    def encode(self, texts: list[str], batch_size: int = 256) -> np.ndarray:
+        """L2-normalized embeddings, one row per text."""
+        self._load()
+        return np.asarray(self._model.encode(texts, batch_size=batch_size,
+                                             normalize_embeddings=True), dtype=np.float32)
+
     def similarity(self, text_a: str, text_b: str) -> float:
         self._load()
         embs = self._model.encode([text_a, text_b], normalize_embeddings=True)
@@ -34,6 +40,13 @@ class EmbeddingSimilarity(Comparator):
         ref = embs[0]
         return [max(0.0, min(1.0, float(np.dot(ref, embs[i+1])))) for i in range(len(candidates))]
 
+    def pairwise_similarity(self, texts: list[str]) -> list[float]:
+        """Similarities of all unordered pairs (i < j), from one encode and one matrix product."""
+        self._load()
+        embs = self._model.encode(texts, normalize_embeddings=True)
+        iu = np.triu_indices(len(texts), k=1)
+        return np.clip(embs @ embs.T, 0.0, 1.0)[iu].tolist()
+
 
 class ExactMatch(Comparator):
     def similarity(self, text_a: str, text_b: str) -> float:
@@ -0,0 +1,69 @@
+from __future__ import annotations
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+
+@dataclass
+class _Node:
+    fn: Callable[..., Awaitable[Any]]
+    deps: tuple[str, ...] = ()
+    soft: tuple[str, ...] = ()
+    end: float = 0.0
+
+
+class ProbeGraph:
+    """A small dependency graph of async steps, run with maximal concurrency.
+
+    Each node starts as soon as its ``deps`` have finished and receives their values as
+    positional arguments. ``soft`` deps are not awaited up front; the node awaits them itself
+    via ``graph.wait(name)`` (e.g. scoring streamed variant outputs against the original as they
+    arrive), but they still count when tracing the critical path.
+    """
+
+    def __init__(self, sink: str = "result"):
+        self.sink = sink
+        self._nodes: dict[str, _Node] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._t0 = 0.0
+
+    def add(self, name: str, fn: Callable[..., Awaitable[Any]], deps: tuple[str, ...] = (),
+            soft: tuple[str, ...] = ()) -> None:
+        self._nodes[name] = _Node(fn, tuple(deps), tuple(soft))
+
+    async def wait(self, name: str) -> Any:
+        return await asyncio.shield(self._tasks[name])
+
+    async def _run_node(self, name: str) -> Any:
+        node = self._nodes[name]
+        args = [await asyncio.shield(self._tasks[d]) for d in node.deps]
+        try:
+            return await node.fn(*args)
+        finally:
+            node.end = time.perf_counter()
+
+    async def run(self) -> Any:
+        """Run every node and return the sink's value."""
+        self._t0 = time.perf_counter()
+        self._tasks = {name: asyncio.ensure_future(self._run_node(name)) for name in self._nodes}
+        try:
+            return await self._tasks[self.sink]
+        finally:
+            for t in self._tasks.values():
+                if not t.done():
+                    t.cancel()
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def critical_path(self) -> list[str]:
+        """Chain of nodes ending at the sink, following the last-finishing predecessor."""
+        path, name = [], self.sink
+        while name is not None:
+            path.append(name)
+            preds = [d for d in self._nodes[name].deps + self._nodes[name].soft
+                     if self._nodes[d].end]
+            name = max(preds, key=lambda d: self._nodes[d].end) if preds else None
+        return path[::-1]
+
+    def critical_path_ms(self) -> float:
+        return round((self._nodes[self.sink].end - self._t0) * 1000, 1)
@@ -0,0 +1,7 @@
+import hashlib
+
+
+def input_hash(text: str) -> int:
+    """Stable 64-bit hash of an input, used to key runs, baselines and perturbation seeds."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Clustering:
+    labels: np.ndarray            # cluster index per input
+    representatives: np.ndarray   # input index of each cluster's representative
+    weights: np.ndarray           # cluster sizes
+
+    @property
+    def n_clusters(self) -> int:
+        return len(self.representatives)
+
+
+def cluster_embeddings(
+    embs: np.ndarray,
+    threshold: float = 0.9,
+    block_size: int = 4096,
+) -> Clustering:
+    """Greedy leader clustering of L2-normalized embeddings by cosine similarity.
+
+    Inputs are processed in blocks: each block is matched against the existing
+    representatives with blockwise matrix products, and the leftovers are clustered
+    among themselves from the block's own Gram matrix. An input joins the most
+    similar representative at or above ``threshold``, otherwise it starts a new cluster.
+    """
+    embs = np.asarray(embs, dtype=np.float32)
+    if len(embs) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return Clustering(labels=empty, representatives=empty, weights=empty)
+    n, dim = embs.shape
+    labels = np.full(n, -1, dtype=np.int64)
+    reps: list[int] = []
+    rep_embs = np.empty((0, dim), dtype=np.float32)
+
+    for lo in range(0, n, block_size):
+        block = embs[lo:lo + block_size]
+        best = np.full(len(block), -np.inf, dtype=np.float32)
+        best_label = np.full(len(block), -1, dtype=np.int64)
+        for rlo in range(0, len(rep_embs), block_size):
+            sims = block @ rep_embs[rlo:rlo + block_size].T
+            arg = sims.argmax(axis=1)
+            top = sims[np.arange(len(block)), arg]
+            better = top > best
+            best[better] = top[better]
+            best_label[better] = arg[better] + rlo
+        matched = best >= threshold
+        labels[lo:lo + len(block)][matched] = best_label[matched]
+
+        left = np.flatnonzero(~matched)
+        if len(left) == 0:
+            continue
+        gram = block[left] @ block[left].T
+        local = np.full(len(left), -1, dtype=np.int64)
+        new_reps = []
+        for i in range(len(left)):
+            if local[i] >= 0:
+                continue
+            label = len(reps) + len(new_reps)
+            new_reps.append(lo + left[i])
+            members = (local < 0) & (gram[i] >= threshold)
+            members[:i] = False
+            local[members] = label
+            local[i] = label
+        labels[lo + left] = local
+        reps.extend(new_reps)
+        rep_embs = np.vstack([rep_embs, embs[new_reps]])
+
+    return Clustering(
+        labels=labels,
+        representatives=np.array(reps, dtype=np.int64),
+        weights=np.bincount(labels, minlength=len(reps)),
+    )
+
+
+def minimize_inputs(
+    inputs: list[str],
+    threshold: float = 0.9,
+    block_size: int = 4096,
+    comparator=None,
+) -> tuple[list[str], list[int], Clustering]:
+    """Reduce ``inputs`` to one representative per near-duplicate cluster, with cluster sizes."""
+    from probe.core.comparators import EmbeddingSimilarity
+    if not inputs:
+        return [], [], cluster_embeddings(np.empty((0, 0), dtype=np.float32))
+    comp = comparator or EmbeddingSimilarity()
+    clustering = cluster_embeddings(comp.encode(inputs), threshold, block_size)
+    reps = [inputs[i] for i in clustering.representatives]
+    return reps, clustering.weights.tolist(), clustering
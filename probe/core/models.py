@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from probe.core.store import ResultStore, ResultsView
 
 
 class Verdict(Enum):
@@ -26,34 +29,73 @@ class ProbeResult:
         return self.verdict == Verdict.PASS
 
 
-@dataclass
 class SuiteResult:
-    results: list[ProbeResult] = field(default_factory=list)
-    model_name: str = ""
-    total_elapsed_ms: float = 0.0
+    """Suite-level view over a ``ResultStore``; counters are maintained incrementally."""
+
+    def __init__(
+        self,
+        results: list[ProbeResult] | None = None,
+        model_name: str = "",
+        total_elapsed_ms: float = 0.0,
+        store: "ResultStore | None" = None,
+    ):
+        from probe.core.store import ResultStore
+        self.store = store if store is not None else ResultStore()
+        if results:
+            self.store.extend(results)
+        self.model_name = model_name
+        self.total_elapsed_ms = total_elapsed_ms
+        self.stats: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return (f"SuiteResult(model_name={self.model_name!r}, total={self.total}, "
+                f"passed={self.passed}, failed={self.failed}, errors={self.errors})")
+
+    @property
+    def results(self) -> "ResultsView":
+        from probe.core.store import ResultsView
+        return ResultsView(self.store)
+
+    def add(self, result: ProbeResult) -> None:
+        self.store.append(result)
+
+    def close(self) -> None:
+        """Release the store's spill file, if any."""
+        self.store.close()
+
+    def __enter__(self) -> "SuiteResult":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     @property
     def total(self) -> int:
-        return len(self.results)
+        return len(self.store)
 
     @property
     def passed(self) -> int:
-        return sum(1 for r in self.results if r.passed)
+        return self.store.passed
 
     @property
     def failed(self) -> int:
-        return sum(1 for r in self.results if r.verdict == Verdict.FAIL)
+        return self.store.failed
 
     @property
     def errors(self) -> int:
-        return sum(1 for r in self.results if r.verdict == Verdict.ERROR)
+        return self.store.errors
 
     @property
     def pass_rate(self) -> float:
-        return self.passed / self.total if self.total > 0 else 0.0
+        """Pass rate weighted by each input's weight (e.g. its near-duplicate cluster size)."""
+        total = self.store.total_weight
+        return self.store.passed_weight / total if total > 0 else 0.0
 
     def failures(self) -> list[ProbeResult]:
-        return [r for r in self.results if not r.passed]
+        from probe.core.store import ResultsView, PASS
+        order = self.store.order()
+        rows = order[self.store.verdict_codes[order] != PASS]
+        return list(ResultsView(self.store, rows))
 
     def to_dict(self) -> dict:
         return {
@@ -64,6 +106,7 @@ class SuiteResult:
             "errors": self.errors,
             "pass_rate": round(self.pass_rate, 4),
             "elapsed_ms": round(self.total_elapsed_ms, 1),
+            "stats": self.stats,
             "results": [
                 {
                     "input": r.input[:80],
@@ -0,0 +1,182 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+
+from probe.core.hashing import input_hash
+
+_M64 = np.uint64
+_GOLDEN = _M64(0x9E3779B97F4A7C15)
+_MIX1 = _M64(0xBF58476D1CE4E5B9)
+_MIX2 = _M64(0x94D049BB133111EB)
+_POS = _M64(0xD6E8FEB86659FD93)
+_STREAM = _M64(0xA0761D6478BD642F)
+
+_KEYBOARD_ROWS = ["1234567890", "qwertyuiop", "asdfghjkl", "zxcvbnm"]
+
+# Operation codes, in the order their rates are stacked.
+SUBSTITUTE, DELETE, INSERT, CASE, WHITESPACE, SWAP, KEEP = range(7)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        z = x + _GOLDEN
+        z = (z ^ (z >> _M64(30))) * _MIX1
+        z = (z ^ (z >> _M64(27))) * _MIX2
+    return z ^ (z >> _M64(31))
+
+
+def _keyboard_table() -> tuple[np.ndarray, np.ndarray]:
+    """ASCII code -> up to 8 keyboard-neighbor codes, and the neighbor count per code."""
+    pos = {c: (r, i) for r, row in enumerate(_KEYBOARD_ROWS) for i, c in enumerate(row)}
+    table = np.zeros((128, 8), dtype=np.uint32)
+    counts = np.zeros(128, dtype=np.int64)
+    for c, (r, i) in pos.items():
+        near = [
+            _KEYBOARD_ROWS[rr][ii]
+            for rr in (r - 1, r, r + 1) if 0 <= rr < len(_KEYBOARD_ROWS)
+            for ii in (i - 1, i, i + 1) if 0 <= ii < len(_KEYBOARD_ROWS[rr])
+            if (rr, ii) != (r, i)
+        ][:8]
+        for code, chars in ((ord(c), near), (ord(c.upper()), [n.upper() for n in near])):
+            table[code, :len(chars)] = [ord(n) for n in chars]
+            counts[code] = len(chars)
+    return table, counts
+
+
+_NEIGHBORS, _NEIGHBOR_COUNTS = _keyboard_table()
+
+
+@dataclass
+class PerturbationConfig:
+    """Per-character probabilities for each kind of typo."""
+
+    substitute: float = 0.02
+    delete: float = 0.01
+    insert: float = 0.01
+    case: float = 0.01
+    whitespace: float = 0.02
+    swap: float = 0.01
+    min_length: int = 4
+
+    def __post_init__(self):
+        rates = self._rates()
+        if any(r < 0 for r in rates) or sum(rates) > 1.0 + 1e-9:
+            raise ValueError(f"Typo rates must be non-negative and sum to at most 1, got {rates}")
+
+    def _rates(self) -> list[float]:
+        return [self.substitute, self.delete, self.insert, self.case, self.whitespace, self.swap]
+
+    def thresholds(self) -> np.ndarray:
+        return np.cumsum(self._rates())
+
+
+class PerturbationEngine:
+    """Seeded, vectorized typo generator.
+
+    Every random draw is a counter-based hash of (seed, input hash, variant, position), so a given
+    seed always yields byte-identical variants for an input, independent of batch composition.
+    """
+
+    def __init__(self, config: PerturbationConfig | None = None, seed: int = 0):
+        self.config = config or PerturbationConfig()
+        self.seed = seed
+
+    def _uniform(self, keys: np.ndarray, pos: np.ndarray, variant: int, stream: int) -> np.ndarray:
+        with np.errstate(over="ignore"):
+            x = keys + pos.astype(np.uint64) * _POS + _M64(variant * 4 + stream) * _STREAM
+        return (_splitmix64(x) >> _M64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def perturb_many(self, texts: list[str], n: int = 3) -> list[list[str]]:
+        """Return ``n`` perturbed variants for each text, in one bulk pass per variant."""
+        if not texts:
+            return []
+        lengths = np.array([len(t) for t in texts], dtype=np.int64)
+        cps = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+        if len(cps) == 0:
+            return [[t] * n for t in texts]
+        owner = np.repeat(np.arange(len(texts)), lengths)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        pos = np.arange(len(cps), dtype=np.int64) - starts[owner]
+        seed_key = _splitmix64(np.array([self.seed], dtype=np.uint64))[0]
+        keys = _splitmix64(np.array([input_hash(t) for t in texts], dtype=np.uint64) ^ seed_key)
+        char_keys = keys[owner]
+        active = lengths[owner] >= self.config.min_length
+
+        out: list[list[str]] = [[] for _ in texts]
+        for v in range(n):
+            for i, variant in enumerate(self._variant(texts, cps, owner, pos, lengths, char_keys,
+                                                      active, v)):
+                out[i].append(variant)
+        return out
+
+    def _variant(self, texts, cps, owner, pos, lengths, char_keys, active, v) -> list[str]:
+        cfg = self.config
+        r_op = self._uniform(char_keys, pos, v, 0)
+        r_arg = self._uniform(char_keys, pos, v, 1)
+        op = np.searchsorted(cfg.thresholds(), r_op, side="right")
+
+        ascii_ = cps < 128
+        n_near = np.where(ascii_, _NEIGHBOR_COUNTS[np.minimum(cps, 127)], 0)
+        is_space = cps == ord(" ")
+        is_alpha = ascii_ & (((cps | 32) >= ord("a")) & ((cps | 32) <= ord("z")))
+        has_next = pos < lengths[owner] - 1
+        # Swapping two equal characters is a no-op, so it doesn't count as an edit.
+        swap_changes = has_next & (cps != np.concatenate((cps[1:], [0])).astype(cps.dtype))
+
+        eligible = np.select(
+            [op == SUBSTITUTE, op == INSERT, op == CASE, op == WHITESPACE, op == SWAP,
+             op == DELETE],
+            [n_near > 0, n_near > 0, is_alpha, is_space, swap_changes, True],
+            default=False,
+        ) & active
+        op = np.where(eligible, op, KEEP)
+
+        # Guarantee at least one edit per eligible text, at its lowest-draw position among the
+        # best available kind: a swap that changes the text, else a substitution, else a deletion.
+        edited = np.bincount(owner[op != KEEP], minlength=len(texts)) > 0
+        need = ~edited[owner] & active
+        if need.any():
+            kind = np.where(swap_changes, 0, np.where(n_near > 0, 1, 2))
+            idx = np.flatnonzero(need)
+            order = idx[np.lexsort((r_op[idx], kind[idx], owner[idx]))]
+            first = order[np.concatenate(([True], owner[order][1:] != owner[order][:-1]))]
+            op[first] = np.array([SWAP, SUBSTITUTE, DELETE])[kind[first]]
+
+        # A swap consumes the next character too; drop chains and whatever op that char had.
+        swap = op == SWAP
+        swap &= ~np.concatenate(([False], swap[:-1]))
+        op = np.where((op == SWAP) & ~swap, KEEP, op)
+        swapped_next = np.concatenate(([False], swap[:-1]))
+        op = np.where(swapped_next, KEEP, op)
+
+        choice = (r_arg * np.maximum(n_near, 1)).astype(np.int64)
+        neighbor = _NEIGHBORS[np.minimum(cps, 127), np.minimum(choice, 7)]
+
+        first_ch = cps.copy()
+        second_ch = np.zeros_like(cps)
+        count = np.ones(len(cps), dtype=np.int64)
+
+        m = op == SUBSTITUTE
+        first_ch[m] = neighbor[m]
+        count[op == DELETE] = 0
+        m = op == INSERT
+        second_ch[m] = neighbor[m]
+        count[m] = 2
+        m = op == CASE
+        first_ch[m] ^= 32
+        m = op == WHITESPACE
+        drop = m & (r_arg < 0.5)
+        count[drop] = 0
+        double = m & ~drop
+        second_ch[double] = ord(" ")
+        count[double] = 2
+        first_ch[swap] = cps[np.flatnonzero(swap) + 1]
+        first_ch[swapped_next] = cps[np.flatnonzero(swapped_next) - 1]
+
+        pairs = np.stack([first_ch, second_ch], axis=1).ravel()
+        keep = np.stack([count >= 1, count >= 2], axis=1).ravel()
+        joined = pairs[keep].astype("<u4").tobytes().decode("utf-32-le")
+        out_lengths = np.bincount(owner, weights=count, minlength=len(texts)).astype(np.int64)
+        bounds = np.concatenate(([0], np.cumsum(out_lengths)))
+        return [joined[bounds[i]:bounds[i + 1]] for i in range(len(texts))]
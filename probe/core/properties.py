@@ -1,11 +1,16 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
+import asyncio
+import time
+from abc import ABC
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from probe.providers.base import LLMProvider
 
+from probe.core.graph import ProbeGraph
 from probe.core.models import ProbeResult
 
 
@@ -15,21 +20,106 @@ class PropertyConfig:
     comparator: str = "embedding"
 
 
+def _embed_one(comp, text: str):
+    """The text's embedding, or None for comparators that don't embed."""
+    return comp.encode([text])[0] if hasattr(comp, "encode") else None
+
+
+def _score_one(comp, reference: str, ref_emb, output: str) -> float:
+    if ref_emb is None:
+        return comp.similarity(reference, output)
+    return max(0.0, min(1.0, float(np.dot(ref_emb, _embed_one(comp, output)))))
+
+
 class Property(ABC):
+    """A testable behavior of a model.
+
+    Subclasses describe one probe as a ``ProbeGraph`` in ``graph()``, which the default
+    ``test()`` runs while recording the critical path, or override ``test()`` directly.
+    """
+
     name: str = "base_property"
+    packable: bool = False
+    uses_baseline: bool = False
+    deferred: bool = False  # run_suite holds results back and scores them with finalize()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.graph is Property.graph and cls.test is Property.test:
+            raise TypeError(f"{cls.__name__} must implement graph() or test()")
 
     def __init__(self, config: PropertyConfig | None = None):
         self.config = config or PropertyConfig()
+        self._comparator = None
+
+    def prepare(self, inputs: list[str]) -> None:
+        """Hook for bulk, provider-free precomputation over the whole suite before it runs."""
+
+    def finalize(self, results: list[ProbeResult]) -> None:
+        """Hook for ``deferred`` properties: score all of a suite's results in place, in bulk."""
+
+    def graph(self, input_text: str, provider: "LLMProvider") -> ProbeGraph:
+        """Express the probe as a ``ProbeGraph`` whose ``result`` node yields the ProbeResult."""
+        raise NotImplementedError(f"{type(self).__name__} does not implement graph()")
 
-    @abstractmethod
     async def test(self, input_text: str, provider: "LLMProvider") -> ProbeResult:
-        ...
+        t0 = time.perf_counter()
+        graph = self.graph(input_text, provider)
+        result = await graph.run()
+        result.elapsed_ms = (time.perf_counter() - t0) * 1000
+        result.details["critical_path"] = graph.critical_path()
+        result.details["critical_path_ms"] = graph.critical_path_ms()
+        return result
+
+    def _variant_scores(self, graph: ProbeGraph, provider: "LLMProvider",
+                        original: str = "original"):
+        """Node fn: generate each variant and score it against ``original`` as it arrives.
+
+        The original is embedded once when it lands; each variant is then scored on a worker
+        thread as soon as its output exists, so encodes never block the event loop.
+        """
+        comp = self._get_comparator()
+
+        async def score(prompts: list[str]) -> tuple[list[str], list[float]] | None:
+            if not prompts:
+                return None
+            loop = asyncio.get_running_loop()
+
+            async def reference():
+                text = await graph.wait(original)
+                return text, await loop.run_in_executor(None, _embed_one, comp, text)
+
+            async def one(i: int, prompt: str) -> tuple[int, str]:
+                return i, await provider.generate(prompt)
+
+            ref = asyncio.ensure_future(reference())
+            tasks = [asyncio.ensure_future(one(i, p)) for i, p in enumerate(prompts)]
+            outputs, scores = [""] * len(prompts), [0.0] * len(prompts)
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    i, out = await next_done
+                    text, ref_emb = await asyncio.shield(ref)
+                    outputs[i] = out
+                    scores[i] = await loop.run_in_executor(None, _score_one, comp, text,
+                                                           ref_emb, out)
+            finally:
+                for t in [ref, *tasks]:
+                    t.cancel()
+            return outputs, scores
+
+        return score
+
+    def set_comparator(self, comparator) -> None:
+        """Share an already-loaded comparator (e.g. a session's embedding model)."""
+        self._comparator = comparator
 
     def _get_comparator(self):
-        from probe.core.comparators import EmbeddingSimilarity, ExactMatch, ContainsMatch
-        mapping = {
-            "embedding": EmbeddingSimilarity,
-            "exact": ExactMatch,
-            "contains": ContainsMatch,
-        }
-        return mapping.get(self.config.comparator, EmbeddingSimilarity)()
+        if self._comparator is None:
+            from probe.core.comparators import EmbeddingSimilarity, ExactMatch, ContainsMatch
+            mapping = {
+                "embedding": EmbeddingSimilarity,
+                "exact": ExactMatch,
+                "contains": ContainsMatch,
+            }
+            self._comparator = mapping.get(self.config.comparator, EmbeddingSimilarity)()
+        return self._comparator
@@ -1,14 +1,21 @@
+import heapq
+import html
 import json
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from probe.core.models import SuiteResult, Verdict
+from probe.core.models import ProbeResult, SuiteResult
+from probe.core.store import PASS, FAIL, ERROR
 
 console = Console()
 
+FULL_REPORT_LIMIT = 200
+_BARS = "\u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
 
-def print_summary(suite: SuiteResult):
+
+def _print_header(suite: SuiteResult):
     status = "ALL PASSED" if suite.failed == 0 and suite.errors == 0 else "FAILURES DETECTED"
     color = "green" if suite.failed == 0 else "red"
     icon = "\u2705" if suite.failed == 0 else "\u274c"
@@ -27,8 +34,12 @@ def print_summary(suite: SuiteResult):
         f"Pass Rate: [bold]{suite.pass_rate:.1%}[/bold]  "
         f"Time: [dim]{suite.total_elapsed_ms:.0f}ms[/dim]"
     )
+    if suite.stats:
+        console.print("  " + "  ".join(f"{k}: [dim]{v}[/dim]" for k, v in suite.stats.items()))
     console.print()
 
+
+def _results_table(results) -> Table:
     tbl = Table(show_header=True, header_style="bold", show_lines=False)
     tbl.add_column("", width=3)
     tbl.add_column("Input", max_width=50, no_wrap=True)
@@ -36,7 +47,7 @@ def print_summary(suite: SuiteResult):
     tbl.add_column("Score", justify="right")
     tbl.add_column("Verdict", justify="center")
 
-    for r in suite.results:
+    for r in results:
         ic = {"pass": "\u2705", "fail": "\u274c", "error": "\u26a0\ufe0f"}[r.verdict.value]
         sc = "green" if r.score >= 0.8 else "yellow" if r.score >= 0.5 else "red"
         tbl.add_row(
@@ -46,19 +57,162 @@ def print_summary(suite: SuiteResult):
             f"[{sc}]{r.score:.2f}[/{sc}]",
             f"[{sc}]{r.verdict.value.upper()}[/{sc}]",
         )
-    console.print(tbl)
+    return tbl
+
+
+def _print_failure(r: ProbeResult):
+    console.print(f"  [red]\u2717[/red] [bold]{r.property_name}[/bold] on: {r.input[:60]}")
+    console.print(f"    Score: {r.score:.3f} (threshold: {r.details.get('threshold', '?')})")
+    if r.original_output:
+        console.print(f"    Original: [dim]{r.original_output[:100]}[/dim]")
+    for i, v in enumerate(r.variant_outputs[:3]):
+        console.print(f"    Variant {i+1}: [dim]{v[:100]}[/dim]")
+    console.print()
+
+
+def print_summary(suite: SuiteResult, mode: str = "auto", top_k: int = 10):
+    """Print results; ``mode`` is ``full``, ``aggregate`` or ``auto`` (aggregate when large)."""
+    if mode == "aggregate" or (mode == "auto" and suite.total > FULL_REPORT_LIMIT):
+        print_aggregate(suite, top_k=top_k)
+        return
+    _print_header(suite)
+    console.print(_results_table(suite.results))
 
     failures = suite.failures()
     if failures:
         console.print(f"\n[bold red]-- Failure Details ({len(failures)}) --[/bold red]\n")
         for r in failures:
-            console.print(f"  [red]\u2717[/red] [bold]{r.property_name}[/bold] on: {r.input[:60]}")
-            console.print(f"    Score: {r.score:.3f} (threshold: {r.details.get('threshold', '?')})")
-            if r.original_output:
-                console.print(f"    Original: [dim]{r.original_output[:100]}[/dim]")
-            for i, v in enumerate(r.variant_outputs[:3]):
-                console.print(f"    Variant {i+1}: [dim]{v[:100]}[/dim]")
-            console.print()
+            _print_failure(r)
+
+
+def property_aggregates(suite: SuiteResult, bins: int = 10) -> list[dict]:
+    """Per-property counts, mean score and score histogram, computed from the store columns.
+
+    Pass rates and mean scores are weighted by input weight, like ``SuiteResult.pass_rate``.
+    """
+    store = suite.store
+    n_props = len(store.property_names)
+    pids = store.property_ids
+    cells = pids * 3 + store.verdict_codes
+    counts = np.bincount(cells, minlength=n_props * 3).reshape(n_props, 3)
+    weighted = np.bincount(cells, weights=store.weights, minlength=n_props * 3).reshape(n_props, 3)
+    sums = np.bincount(pids, weights=store.weights * store.scores, minlength=n_props)
+    out = []
+    for pid, name in enumerate(store.property_names):
+        total = int(counts[pid].sum())
+        mass = weighted[pid].sum()
+        if total == 0:
+            continue
+        hist, _ = np.histogram(store.scores[pids == pid], bins=bins, range=(0.0, 1.0))
+        out.append({
+            "property": name,
+            "total": total,
+            "passed": int(counts[pid, PASS]),
+            "failed": int(counts[pid, FAIL]),
+            "errors": int(counts[pid, ERROR]),
+            "pass_rate": float(weighted[pid, PASS] / mass) if mass > 0 else 0.0,
+            "mean_score": float(sums[pid] / mass) if mass > 0 else 0.0,
+            "histogram": hist.tolist(),
+        })
+    return out
+
+
+def _sparkline(hist: list[int]) -> str:
+    top = max(hist) if hist else 0
+    if top == 0:
+        return ""
+    return "".join(" " if h == 0 else _BARS[(h * (len(_BARS) - 1)) // top] for h in hist)
+
+
+def top_failures(suite: SuiteResult, k: int = 10) -> list[ProbeResult]:
+    """The ``k`` lowest-scoring failures, selected with a heap (no full sort)."""
+    store = suite.store
+    rows = np.flatnonzero(store.verdict_codes != PASS)
+    worst = heapq.nsmallest(k, zip(store.scores[rows].tolist(), rows.tolist()))
+    return [store.row(r) for _, r in worst]
+
+
+def print_aggregate(suite: SuiteResult, top_k: int = 10):
+    _print_header(suite)
+
+    tbl = Table(show_header=True, header_style="bold", show_lines=False)
+    tbl.add_column("Property", style="cyan")
+    tbl.add_column("Total", justify="right")
+    tbl.add_column("Pass Rate", justify="right")
+    tbl.add_column("Failed", justify="right")
+    tbl.add_column("Errors", justify="right")
+    tbl.add_column("Mean Score", justify="right")
+    tbl.add_column("Scores 0\u21921")
+    for agg in property_aggregates(suite):
+        sc = "green" if agg["pass_rate"] >= 0.8 else "yellow" if agg["pass_rate"] >= 0.5 else "red"
+        tbl.add_row(
+            agg["property"], str(agg["total"]),
+            f"[{sc}]{agg['pass_rate']:.1%}[/{sc}]",
+            f"[red]{agg['failed']}[/red]", f"[yellow]{agg['errors']}[/yellow]",
+            f"{agg['mean_score']:.3f}", _sparkline(agg["histogram"]),
+        )
+    console.print(tbl)
+
+    worst = top_failures(suite, top_k)
+    if worst:
+        console.print(f"\n[bold red]-- Worst {len(worst)} of "
+                      f"{suite.failed + suite.errors} Failures --[/bold red]\n")
+        for r in worst:
+            _print_failure(r)
+
+
+def print_page(suite: SuiteResult, page: int = 1, page_size: int = 50):
+    """Print one page (1-based) of the per-result table."""
+    pages = max(1, -(-suite.total // page_size))
+    page = min(max(page, 1), pages)
+    lo = (page - 1) * page_size
+    console.print(_results_table(suite.results[lo:lo + page_size]))
+    console.print(f"  [dim]Page {page}/{pages} ({suite.total} results)[/dim]")
+
+
+def export_html(suite: SuiteResult, path: str):
+    """Write an HTML report in a single streaming pass over the results."""
+    esc = html.escape
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                f"<title>Probe Results - {esc(suite.model_name)}</title>\n<style>"
+                "body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}"
+                "td,th{border:1px solid #ddd;padding:4px 8px;text-align:left;vertical-align:top}"
+                ".pass{color:#2a2}.fail{color:#c22}.error{color:#b80}"
+                "details pre{white-space:pre-wrap;max-width:80em}"
+                "</style></head><body>\n")
+        f.write(f"<h1>Probe Results - {esc(suite.model_name)}</h1>\n"
+                f"<p>Total: {suite.total} &middot; Passed: {suite.passed} &middot; "
+                f"Failed: {suite.failed} &middot; Errors: {suite.errors} &middot; "
+                f"Pass Rate: {suite.pass_rate:.1%} &middot; "
+                f"Time: {suite.total_elapsed_ms:.0f}ms</p>\n")
+
+        f.write("<h2>Properties</h2>\n<table><tr><th>Property</th><th>Total</th>"
+                "<th>Pass Rate</th><th>Mean Score</th><th>Histogram</th></tr>\n")
+        for agg in property_aggregates(suite):
+            f.write(f"<tr><td>{esc(agg['property'])}</td><td>{agg['total']}</td>"
+                    f"<td>{agg['pass_rate']:.1%}</td><td>{agg['mean_score']:.3f}</td>"
+                    f"<td>{_sparkline(agg['histogram'])}</td></tr>\n")
+        f.write("</table>\n")
+
+        f.write("<h2>Results</h2>\n<table><tr><th>Input</th><th>Property</th>"
+                "<th>Score</th><th>Verdict</th></tr>\n")
+        for r in suite.results:
+            v = r.verdict.value
+            f.write(f"<tr><td>{esc(r.input)}")
+            if not r.passed and (r.original_output or r.variant_outputs or r.details):
+                f.write("<details><summary>outputs</summary>")
+                if r.original_output:
+                    f.write(f"<b>Original</b><pre>{esc(r.original_output)}</pre>")
+                for i, out in enumerate(r.variant_outputs):
+                    f.write(f"<b>Variant {i + 1}</b><pre>{esc(out)}</pre>")
+                if r.details:
+                    f.write(f"<pre>{esc(json.dumps(r.details, default=str))}</pre>")
+                f.write("</details>")
+            f.write(f"</td><td>{esc(r.property_name)}</td><td>{r.score:.3f}</td>"
+                    f"<td class=\"{v}\">{v.upper()}</td></tr>\n")
+        f.write("</table>\n</body></html>\n")
+    console.print(f"[dim]HTML report written to {path}[/dim]")
 
 
 def export_json(suite: SuiteResult, path: str):
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from probe.core.models import ProbeResult, SuiteResult, Verdict
 from probe.core.properties import Property
+from probe.core.store import ResultStore
 
 if TYPE_CHECKING:
     from probe.providers.base import LLMProvider
@@ -26,23 +27,59 @@ async def run_suite(
     inputs: list[str],
     properties: list[Property],
     concurrency: int = 5,
+    retain: str = "all",
+    spill_dir: str | None = None,
+    weights: list[float] | None = None,
 ) -> SuiteResult:
+    if weights is None:
+        weights = [1.0] * len(inputs)
+    elif len(weights) != len(inputs):
+        raise ValueError(f"Got {len(weights)} weights for {len(inputs)} inputs")
     start = _time.perf_counter()
     sem = asyncio.Semaphore(concurrency)
+    store = ResultStore(retain=retain, spill_dir=spill_dir)
+    for prop in properties:
+        prop.prepare(inputs)
+    try:
+        await provider.warmup()
+    except Exception:
+        pass  # a backend that is really down surfaces as per-probe errors
+
+    held: dict[Property, list[tuple[int, float, ProbeResult]]] = {
+        prop: [] for prop in properties if prop.deferred}
 
-    async def bounded(prop, inp):
+    async def bounded(seq, prop, inp, weight):
         async with sem:
-            return await _run_single(prop, inp, provider)
+            result = await _run_single(prop, inp, provider)
+        if prop.deferred:
+            held[prop].append((seq, weight, result))
+        else:
+            store.append(result, seq=seq, weight=weight)
 
-    tasks = [bounded(prop, inp) for inp in inputs for prop in properties]
-    results = await asyncio.gather(*tasks)
+    jobs = [(inp, w, prop) for inp, w in zip(inputs, weights) for prop in properties]
+    await asyncio.gather(*[bounded(i, prop, inp, w) for i, (inp, w, prop) in enumerate(jobs)])
+
+    loop = asyncio.get_running_loop()
+    for prop, rows in held.items():
+        results = [r for _, _, r in rows]
+        try:
+            await loop.run_in_executor(None, prop.finalize, results)
+        except Exception as e:
+            for r in results:
+                if "error" not in r.details:
+                    r.verdict, r.score = Verdict.ERROR, 0.0
+                    r.details["error"] = str(e)
+        for seq, weight, r in rows:
+            store.append(r, seq=seq, weight=weight)
     elapsed = (_time.perf_counter() - start) * 1000
 
-    return SuiteResult(
-        results=list(results),
+    suite = SuiteResult(
         model_name=provider.model_name,
         total_elapsed_ms=elapsed,
+        store=store,
     )
+    suite.stats = provider.stats()
+    return suite
 
 
 def run_suite_sync(
@@ -50,5 +87,15 @@ def run_suite_sync(
     inputs: list[str],
     properties: list[Property],
     concurrency: int = 5,
+    retain: str = "all",
+    spill_dir: str | None = None,
+    weights: list[float] | None = None,
 ) -> SuiteResult:
-    return asyncio.run(run_suite(provider, inputs, properties, concurrency))
+    async def main():
+        try:
+            return await run_suite(provider, inputs, properties, concurrency, retain, spill_dir,
+                                   weights)
+        finally:
+            await provider.aclose()  # pooled clients can't outlive this loop
+
+    return asyncio.run(main())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+from probe.core.models import SuiteResult
+from probe.core.runner import run_suite
+
+if TYPE_CHECKING:
+    from probe.core.baseline import Baseline
+    from probe.core.comparators import EmbeddingSimilarity
+    from probe.core.properties import Property
+    from probe.providers.base import LLMProvider
+
+
+class ProbeSession:
+    """Keeps providers, properties and the embedding model warm across many runs.
+
+    Use it synchronously (``run``/``compare``), in which case it owns an event loop on a
+    background thread and works even when the caller is already inside a running loop
+    (Jupyter, async services); or asynchronously (``arun``/``acompare``) on the caller's loop.
+    Close it with ``close()``/``aclose()`` or use it as a (async) context manager.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 5,
+        threshold: float = 0.8,
+        retain: str = "all",
+        embedding_model: str = "all-MiniLM-L6-v2",
+    ):
+        self.concurrency = concurrency
+        self.threshold = threshold
+        self.retain = retain
+        self._embedding_model = embedding_model
+        self._embedding: EmbeddingSimilarity | None = None
+        self._providers: dict[tuple, LLMProvider] = {}
+        self._properties: dict[tuple, Property] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    # -- shared state -----------------------------------------------------
+
+    @property
+    def embedding(self) -> "EmbeddingSimilarity":
+        if self._embedding is None:
+            from probe.core.comparators import EmbeddingSimilarity
+            self._embedding = EmbeddingSimilarity(self._embedding_model)
+        return self._embedding
+
+    def get_provider(self, model: str | LLMProvider, **kwargs) -> "LLMProvider":
+        if not isinstance(model, str):
+            return model
+        key = (model, tuple(sorted(kwargs.items())))
+        if key not in self._providers:
+            from probe.providers import get_provider
+            self._providers[key] = get_provider(model, **kwargs)
+        return self._providers[key]
+
+    def get_property(self, name: str, threshold: float | None = None, **kwargs) -> "Property":
+        threshold = self.threshold if threshold is None else threshold
+        key = (name.lower(), threshold, tuple(sorted(kwargs.items())))
+        prop = self._properties.get(key)
+        if prop is None:
+            from probe.properties import get_property
+            prop = self._properties[key] = get_property(name, threshold=threshold, **kwargs)
+            if prop.config.comparator == "embedding":
+                prop.set_comparator(self.embedding)
+        return prop
+
+    # -- async API --------------------------------------------------------
+
+    async def arun(
+        self,
+        model: str | LLMProvider,
+        inputs: list[str],
+        properties: list[str] | None = None,
+        threshold: float | None = None,
+        weights: list[float] | None = None,
+        baseline: str | Baseline | None = None,
+        **run_kwargs: Any,
+    ) -> SuiteResult:
+        from probe.properties import PROPERTY_REGISTRY
+        provider = self.get_provider(model)
+        props = []
+        for name in properties or ["consistency"]:
+            cls = PROPERTY_REGISTRY.get(name.lower())
+            extra = {"baseline": baseline} if getattr(cls, "uses_baseline", False) else {}
+            props.append(self.get_property(name, threshold, **extra))
+        run_kwargs.setdefault("concurrency", self.concurrency)
+        run_kwargs.setdefault("retain", self.retain)
+        return await run_suite(provider, inputs, props, weights=weights, **run_kwargs)
+
+    async def acompare(
+        self,
+        model_a: str | LLMProvider,
+        model_b: str | LLMProvider,
+        inputs: list[str],
+        properties: list[str] | None = None,
+        threshold: float | None = None,
+        weights: list[float] | None = None,
+    ) -> tuple[SuiteResult, SuiteResult]:
+        sa = await self.arun(model_a, inputs, properties, threshold, weights)
+        sb = await self.arun(model_b, inputs, properties, threshold, weights)
+        return sa, sb
+
+    async def aclose(self) -> None:
+        for provider in self._providers.values():
+            await provider.aclose()
+        self._providers.clear()
+
+    async def __aenter__(self) -> "ProbeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    # -- sync API ---------------------------------------------------------
+
+    def _call(self, coro):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever,
+                                            name="probe-session", daemon=True)
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def run(self, model, inputs, properties=None, threshold=None, weights=None, baseline=None,
+            **run_kwargs) -> SuiteResult:
+        return self._call(self.arun(model, inputs, properties, threshold, weights, baseline,
+                                    **run_kwargs))
+
+    def compare(self, model_a, model_b, inputs, properties=None, threshold=None,
+                weights=None) -> tuple[SuiteResult, SuiteResult]:
+        return self._call(self.acompare(model_a, model_b, inputs, properties, threshold,
+                                        weights))
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        self._call(self.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def __enter__(self) -> "ProbeSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,306 @@
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import weakref
+from typing import Any, Iterator, Sequence, overload
+
+import numpy as np
+
+from probe.core.models import ProbeResult, Verdict
+
+RETAIN_POLICIES = ("all", "failures", "none")
+
+VERDICTS: list[Verdict] = [Verdict.PASS, Verdict.FAIL, Verdict.ERROR]
+VERDICT_CODES: dict[Verdict, int] = {v: i for i, v in enumerate(VERDICTS)}
+PASS, FAIL, ERROR = (VERDICT_CODES[v] for v in VERDICTS)
+
+
+class _Column:
+    """Growable numpy array with amortized O(1) append."""
+
+    def __init__(self, dtype, capacity: int = 256):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, value) -> None:
+        if self._n == len(self._data):
+            grown = np.empty(len(self._data) * 2, dtype=self._data.dtype)
+            grown[:self._n] = self._data[:self._n]
+            self._data = grown
+        self._data[self._n] = value
+        self._n += 1
+
+    def view(self) -> np.ndarray:
+        return self._data[:self._n]
+
+
+class TextPool:
+    """Interned text blobs, kept in memory or spilled to a file on disk."""
+
+    def __init__(self, spill_dir: str | None = None):
+        self._ids: dict[Any, int] = {}
+        self._texts: list[str] = []
+        self._file = None
+        self._path: str | None = None
+        if spill_dir is not None:
+            fd, self._path = tempfile.mkstemp(prefix="probe-text-", suffix=".bin", dir=spill_dir)
+            self._file = os.fdopen(fd, "w+b")
+            self._offsets = _Column(np.int64)
+            self._lengths = _Column(np.int64)
+            # Stores that are never closed explicitly still remove their spill file.
+            self._finalizer = weakref.finalize(self, TextPool._remove, self._file, self._path)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def intern(self, text: str) -> int:
+        if self._file is None:
+            idx = self._ids.get(text)
+            if idx is None:
+                idx = self._ids[text] = len(self._texts)
+                self._texts.append(text)
+            return idx
+        data = text.encode("utf-8")
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        idx = self._ids.get(key)
+        if idx is None:
+            idx = self._ids[key] = len(self._offsets)
+            self._file.seek(0, os.SEEK_END)
+            self._offsets.append(self._file.tell())
+            self._lengths.append(len(data))
+            self._file.write(data)
+        return idx
+
+    def get(self, idx: int) -> str:
+        if self._file is None:
+            return self._texts[idx]
+        self._file.flush()
+        self._file.seek(int(self._offsets.view()[idx]))
+        return self._file.read(int(self._lengths.view()[idx])).decode("utf-8")
+
+    @staticmethod
+    def _remove(file, path: str) -> None:
+        file.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._finalizer()
+            self._file = None
+
+
+def _compact_details(details: dict[str, Any]) -> dict[str, Any]:
+    """Drop text-bearing entries (variant prompts etc.) from a result's details."""
+    out = {}
+    for k, v in details.items():
+        if isinstance(v, str) and k != "error":
+            continue
+        if isinstance(v, (list, tuple)) and any(isinstance(x, str) for x in v):
+            continue
+        out[k] = v
+    return out
+
+
+class ResultStore:
+    """Column-oriented storage for probe results.
+
+    Scores, verdicts, property ids and timings live in numpy columns; inputs and
+    outputs are interned in a ``TextPool``. ``retain`` controls which results keep
+    their output texts and full details: ``"all"``, ``"failures"`` (fail/error
+    only) or ``"none"``.
+    """
+
+    def __init__(self, retain: str = "all", spill_dir: str | None = None):
+        if retain not in RETAIN_POLICIES:
+            raise ValueError(f"Unknown retain policy: {retain}. Use {', '.join(RETAIN_POLICIES)}.")
+        self.retain = retain
+        self.texts = TextPool(spill_dir)
+        self.property_names: list[str] = []
+        self._property_ids: dict[str, int] = {}
+
+        self._seq = _Column(np.int64)
+        self._input_id = _Column(np.int64)
+        self._property_id = _Column(np.int32)
+        self._verdict = _Column(np.int8)
+        self._score = _Column(np.float64)
+        self._elapsed = _Column(np.float64)
+        self._weight = _Column(np.float64)
+        self._output_id = _Column(np.int64)
+        self._variant_start = _Column(np.int64)
+        self._variant_len = _Column(np.int32)
+        self._variant_ids = _Column(np.int64)
+        self._details: list[dict[str, Any] | None] = []
+
+        self._counts = [0, 0, 0]
+        self._weighted = [0.0, 0.0, 0.0]
+        self._order: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    # -- writes -----------------------------------------------------------
+
+    def _keeps_text(self, verdict: Verdict) -> bool:
+        if self.retain == "all":
+            return True
+        return self.retain == "failures" and verdict != Verdict.PASS
+
+    def property_id(self, name: str) -> int:
+        pid = self._property_ids.get(name)
+        if pid is None:
+            pid = self._property_ids[name] = len(self.property_names)
+            self.property_names.append(name)
+        return pid
+
+    def append(self, result: ProbeResult, seq: int | None = None, weight: float = 1.0) -> int:
+        row = len(self)
+        code = VERDICT_CODES[result.verdict]
+        keep = self._keeps_text(result.verdict)
+
+        self._seq.append(row if seq is None else seq)
+        self._input_id.append(self.texts.intern(result.input))
+        self._property_id.append(self.property_id(result.property_name))
+        self._verdict.append(code)
+        self._score.append(result.score)
+        self._elapsed.append(result.elapsed_ms)
+        self._weight.append(weight)
+        self._variant_start.append(len(self._variant_ids))
+        if keep:
+            self._output_id.append(self.texts.intern(result.original_output))
+            for v in result.variant_outputs:
+                self._variant_ids.append(self.texts.intern(v))
+            self._variant_len.append(len(result.variant_outputs))
+            details = result.details
+        else:
+            self._output_id.append(-1)
+            self._variant_len.append(0)
+            details = _compact_details(result.details)
+        self._details.append(details or None)
+
+        self._counts[code] += 1
+        self._weighted[code] += weight
+        self._order = None
+        return row
+
+    def extend(self, results) -> None:
+        for r in results:
+            self.append(r)
+
+    # -- reads ------------------------------------------------------------
+
+    @property
+    def passed(self) -> int:
+        return self._counts[PASS]
+
+    @property
+    def failed(self) -> int:
+        return self._counts[FAIL]
+
+    @property
+    def errors(self) -> int:
+        return self._counts[ERROR]
+
+    @property
+    def total_weight(self) -> float:
+        return sum(self._weighted)
+
+    @property
+    def passed_weight(self) -> float:
+        return self._weighted[PASS]
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._score.view()
+
+    @property
+    def verdict_codes(self) -> np.ndarray:
+        return self._verdict.view()
+
+    @property
+    def property_ids(self) -> np.ndarray:
+        return self._property_id.view()
+
+    @property
+    def input_ids(self) -> np.ndarray:
+        return self._input_id.view()
+
+    @property
+    def elapsed_ms(self) -> np.ndarray:
+        return self._elapsed.view()
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weight.view()
+
+    def order(self) -> np.ndarray:
+        """Row indices sorted by submission sequence."""
+        if self._order is None:
+            self._order = np.argsort(self._seq.view(), kind="stable")
+        return self._order
+
+    def mask_for_property(self, name: str) -> np.ndarray:
+        pid = self._property_ids.get(name)
+        if pid is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.property_ids == pid
+
+    def input_text(self, row: int) -> str:
+        return self.texts.get(int(self._input_id.view()[row]))
+
+    def row(self, row: int) -> ProbeResult:
+        out_id = int(self._output_id.view()[row])
+        start = int(self._variant_start.view()[row])
+        n = int(self._variant_len.view()[row])
+        variant_ids = self._variant_ids.view()[start:start + n]
+        return ProbeResult(
+            input=self.input_text(row),
+            property_name=self.property_names[int(self._property_id.view()[row])],
+            verdict=VERDICTS[int(self._verdict.view()[row])],
+            score=float(self._score.view()[row]),
+            details=dict(self._details[row] or {}),
+            original_output=self.texts.get(out_id) if out_id >= 0 else "",
+            variant_outputs=[self.texts.get(int(i)) for i in variant_ids],
+            elapsed_ms=float(self._elapsed.view()[row]),
+        )
+
+    def close(self) -> None:
+        self.texts.close()
+
+
+class ResultsView(Sequence[ProbeResult]):
+    """Read-only, submission-ordered sequence of ``ProbeResult`` views over a store."""
+
+    def __init__(self, store: ResultStore, rows: np.ndarray | None = None):
+        self._store = store
+        self._rows = rows
+
+    def _indices(self) -> np.ndarray:
+        return self._store.order() if self._rows is None else self._rows
+
+    def __len__(self) -> int:
+        return len(self._store) if self._rows is None else len(self._rows)
+
+    @overload
+    def __getitem__(self, i: int) -> ProbeResult: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[ProbeResult]: ...
+
+    def __getitem__(self, i):
+        rows = self._indices()
+        if isinstance(i, slice):
+            return [self._store.row(int(r)) for r in rows[i]]
+        return self._store.row(int(rows[i]))
+
+    def __iter__(self) -> Iterator[ProbeResult]:
+        for r in self._indices():
+            yield self._store.row(int(r))
@@ -1,18 +1,39 @@
 from __future__ import annotations
+import asyncio
+import json
+import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from probe.core.perturb import PerturbationConfig
     from probe.providers.base import LLMProvider
 
 
+def _numbered_lines(raw: str, n: int) -> list[str]:
+    lines = []
+    for line in raw.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        cleaned = line.lstrip("0123456789").lstrip(".-)").strip()
+        if cleaned:
+            lines.append(cleaned)
+    return lines[:n]
+
+
 class Transform(ABC):
     name: str = "base_transform"
+    n: int = 1
 
     @abstractmethod
     async def apply(self, text: str, provider: "LLMProvider | None" = None) -> list[str]:
         ...
 
+    def pack_task(self) -> str | None:
+        """Per-item instruction used by ``PackedTransform``; ``None`` if it can't be packed."""
+        return None
+
 
 class ParaphraseTransform(Transform):
     name = "paraphrase"
@@ -30,15 +51,12 @@ class ParaphraseTransform(Transform):
             f"Text: {text}"
         )
         raw = await provider.generate(prompt)
-        lines = []
-        for line in raw.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            cleaned = line.lstrip("0123456789").lstrip(".-)").strip()
-            if cleaned:
-                lines.append(cleaned)
-        return lines[:self.n]
+        return _numbered_lines(raw, self.n)
+
+
+    def pack_task(self) -> str:
+        return (f"rephrase it in {self.n} different ways. Each rephrasing must preserve "
+                f"the exact same meaning and intent.")
 
 
 class EntitySwapTransform(Transform):
@@ -58,15 +76,13 @@ class EntitySwapTransform(Transform):
             f"Text: {text}"
         )
         raw = await provider.generate(prompt)
-        lines = []
-        for line in raw.strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            cleaned = line.lstrip("0123456789").lstrip(".-)").strip()
-            if cleaned:
-                lines.append(cleaned)
-        return lines[:self.n]
+        return _numbered_lines(raw, self.n)
+
+
+    def pack_task(self) -> str:
+        return (f"create {self.n} variants by swapping named entities (person names, places, "
+                f"organizations, specific numbers) with different but plausible alternatives. "
+                f"Keep the structure and intent identical.")
 
 
 class NegationTransform(Transform):
@@ -84,22 +100,130 @@ class NegationTransform(Transform):
         raw = await provider.generate(prompt)
         return [raw.strip()]
 
+    def pack_task(self) -> str:
+        return ("negate it. If it asks 'Is X true?', change it to 'Is X NOT true?' or "
+                "'Is X false?'. Preserve the topic. Give exactly 1 negated version.")
+
 
 class TypoTransform(Transform):
     name = "typo"
 
-    def __init__(self, n: int = 3):
+    def __init__(self, n: int = 3, seed: int = 0, config: "PerturbationConfig | None" = None):
+        from probe.core.perturb import PerturbationEngine
         self.n = n
+        self.seed = seed
+        self.engine = PerturbationEngine(config, seed=seed)
+        self._cache: dict[str, list[str]] = {}
+
+    def prepare(self, texts: list[str]) -> None:
+        """Generate variants for all ``texts`` in one bulk pass ahead of ``apply``."""
+        todo = list(dict.fromkeys(t for t in texts if t not in self._cache))
+        self._cache.update(zip(todo, self.engine.perturb_many(todo, self.n)))
 
     async def apply(self, text: str, provider: "LLMProvider | None" = None) -> list[str]:
-        import random
-        variants = []
-        for _ in range(self.n):
-            chars = list(text)
-            if len(chars) < 4:
-                variants.append(text)
-                continue
-            idx = random.randint(1, len(chars) - 2)
-            chars[idx], chars[idx + 1] = chars[idx + 1], chars[idx]
-            variants.append("".join(chars))
+        variants = self._cache.get(text)
+        if variants is None:
+            variants = self.engine.perturb_many([text], self.n)[0]
         return variants
+
+
+class PackedTransform(Transform):
+    """Packs concurrent ``apply`` calls into one JSON-in/JSON-out request per ``pack_size`` inputs.
+
+    Calls are flushed once ``pack_size`` are pending or after ``max_wait`` seconds. Items the
+    model returns malformed fall back to the wrapped transform's single-input ``apply``.
+    """
+
+    def __init__(self, inner: Transform, pack_size: int = 8, max_wait: float = 0.05):
+        if inner.pack_task() is None:
+            raise ValueError(f"{type(inner).__name__} does not support packing")
+        self.inner = inner
+        self.name = inner.name
+        self.n = inner.n
+        self.pack_size = pack_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[str, "LLMProvider", asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def apply(self, text: str, provider: "LLMProvider | None" = None) -> list[str]:
+        if provider is None:
+            raise ValueError(f"{type(self.inner).__name__} requires an LLM provider")
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending.append((text, provider, fut))
+        if len(self._pending) >= self.pack_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await fut
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        by_provider: dict[int, list] = {}
+        for item in batch:
+            by_provider.setdefault(id(item[1]), []).append(item)
+        for items in by_provider.values():
+            task = asyncio.ensure_future(self._run_pack(items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _prompt(self, texts: list[str]) -> str:
+        k = len(texts)
+        return (
+            f"You will receive a JSON array of {k} texts. For EACH text, {self.inner.pack_task()}\n"
+            f"Return ONLY a JSON array with exactly {k} elements, in the same order as the input. "
+            f"Each element must be a JSON array of {self.n} string(s).\n\n"
+            f"Texts: {json.dumps(texts, ensure_ascii=False)}"
+        )
+
+    def _parse(self, raw: str, k: int) -> list[list[str] | None]:
+        # Take the first JSON array of k items, ignoring code fences and surrounding prose.
+        raw = re.sub(r"```[a-zA-Z]*", "", raw)
+        decoder, data = json.JSONDecoder(), None
+        start = raw.find("[")
+        while start >= 0:
+            try:
+                found = decoder.raw_decode(raw, start)[0]
+            except json.JSONDecodeError:
+                found = None
+            if isinstance(found, list) and len(found) == k:
+                data = found
+                break
+            start = raw.find("[", start + 1)
+        if data is None:
+            return [None] * k
+        out: list[list[str] | None] = []
+        for item in data:
+            if isinstance(item, str):
+                item = [item]
+            if isinstance(item, list):
+                variants = [v.strip() for v in item if isinstance(v, str) and v.strip()]
+                out.append(variants[:self.n] or None)
+            else:
+                out.append(None)
+        return out
+
+    async def _run_pack(self, items: list[tuple[str, "LLMProvider", asyncio.Future]]):
+        texts = [t for t, _, _ in items]
+        provider = items[0][1]
+        try:
+            parsed = self._parse(await provider.generate(self._prompt(texts)), len(texts))
+        except Exception:
+            parsed = [None] * len(texts)
+
+        async def resolve(text, fut, variants):
+            if fut.done():
+                return
+            try:
+                if variants is None:
+                    variants = await self.inner.apply(text, provider)
+                fut.set_result(variants)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+
+        await asyncio.gather(*[resolve(t, f, v) for (t, _, f), v in zip(items, parsed)])
@@ -2,6 +2,8 @@ from probe.properties.consistency import Consistency
 from probe.properties.invariance import Invariance
 from probe.properties.negation import NegationCoherence
 from probe.properties.robustness import Robustness
+from probe.properties.sampling import SamplingStability
+from probe.properties.drift import Drift
 from probe.core.properties import Property
 
 PROPERTY_REGISTRY: dict[str, type[Property]] = {
@@ -9,6 +11,8 @@ PROPERTY_REGISTRY: dict[str, type[Property]] = {
     "invariance": Invariance,
     "negation": NegationCoherence,
     "robustness": Robustness,
+    "sampling_stability": SamplingStability,
+    "drift": Drift,
 }
 
 
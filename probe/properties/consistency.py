@@ -1,7 +1,7 @@
-import time
+from probe.core.graph import ProbeGraph
 from probe.core.properties import Property, PropertyConfig
 from probe.core.models import ProbeResult, Verdict
-from probe.core.transforms import ParaphraseTransform
+from probe.core.transforms import ParaphraseTransform, PackedTransform
 from probe.providers.base import LLMProvider
 
 
@@ -9,39 +9,41 @@ class Consistency(Property):
     """Rephrase input N ways → check all outputs are semantically equivalent."""
 
     name = "consistency"
+    packable = True
 
-    def __init__(self, n_rephrasings: int = 5, threshold: float = 0.8, comparator: str = "embedding"):
+    def __init__(self, n_rephrasings: int = 5, threshold: float = 0.8,
+                 comparator: str = "embedding", pack_size: int = 1):
         super().__init__(PropertyConfig(threshold=threshold, comparator=comparator))
         self.transform = ParaphraseTransform(n=n_rephrasings)
-
-    async def test(self, input_text: str, provider: LLMProvider) -> ProbeResult:
-        t0 = time.perf_counter()
-        comp = self._get_comparator()
-
-        original = await provider.generate(input_text)
-        variants = await self.transform.apply(input_text, provider)
-        if not variants:
-            return ProbeResult(input=input_text, property_name=self.name,
-                               verdict=Verdict.ERROR, score=0.0,
-                               details={"error": "No rephrasings generated"})
-
-        variant_outputs = await provider.generate_batch(variants)
-        scores = (comp.batch_similarity(original, variant_outputs)
-                  if hasattr(comp, "batch_similarity")
-                  else [comp.similarity(original, vo) for vo in variant_outputs])
-
-        avg = sum(scores) / len(scores) if scores else 0.0
-        pass_frac = sum(1 for s in scores if s >= self.config.threshold) / len(scores)
-        passed = pass_frac >= self.config.threshold
-
-        return ProbeResult(
-            input=input_text, property_name=self.name,
-            verdict=Verdict.PASS if passed else Verdict.FAIL,
-            score=round(avg, 4), original_output=original,
-            variant_outputs=variant_outputs,
-            elapsed_ms=(time.perf_counter() - t0) * 1000,
-            details={"threshold": self.config.threshold,
-                     "pairwise_scores": [round(s, 4) for s in scores],
-                     "pass_fraction": round(pass_frac, 4),
-                     "rephrasings": variants},
-        )
+        if pack_size > 1:
+            self.transform = PackedTransform(self.transform, pack_size=pack_size)
+
+    def graph(self, input_text: str, provider: LLMProvider) -> ProbeGraph:
+        g = ProbeGraph()
+        g.add("original", lambda: provider.generate(input_text))
+        g.add("variants", lambda: self.transform.apply(input_text, provider))
+        g.add("scored", self._variant_scores(g, provider), deps=("variants",), soft=("original",))
+
+        async def result(original, variants, scored) -> ProbeResult:
+            if not variants:
+                return ProbeResult(input=input_text, property_name=self.name,
+                                   verdict=Verdict.ERROR, score=0.0,
+                                   details={"error": "No rephrasings generated"})
+            variant_outputs, scores = scored
+            avg = sum(scores) / len(scores) if scores else 0.0
+            pass_frac = sum(1 for s in scores if s >= self.config.threshold) / len(scores)
+            passed = pass_frac >= self.config.threshold
+
+            return ProbeResult(
+                input=input_text, property_name=self.name,
+                verdict=Verdict.PASS if passed else Verdict.FAIL,
+                score=round(avg, 4), original_output=original,
+                variant_outputs=variant_outputs,
+                details={"threshold": self.config.threshold,
+                         "pairwise_scores": [round(s, 4) for s in scores],
+                         "pass_fraction": round(pass_frac, 4),
+                         "rephrasings": variants},
+            )
+
+        g.add("result", result, deps=("original", "variants", "scored"))
+        return g
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import numpy as np
+from probe.core.baseline import Baseline
+from probe.core.graph import ProbeGraph
+from probe.core.properties import Property, PropertyConfig
+from probe.core.models import ProbeResult, Verdict
+from probe.providers.base import LLMProvider
+
+
+class Drift(Property):
+    """Answer only with the new model → compare against a saved baseline's answer."""
+
+    name = "drift"
+    uses_baseline = True
+    deferred = True
+
+    def __init__(self, baseline: str | Baseline | None = None, threshold: float = 0.8,
+                 comparator: str = "embedding"):
+        super().__init__(PropertyConfig(threshold=threshold, comparator=comparator))
+        self._baseline_src = baseline
+        self._baseline: Baseline | None = baseline if isinstance(baseline, Baseline) else None
+
+    @property
+    def baseline(self) -> Baseline:
+        if self._baseline is None:
+            if self._baseline_src is None:
+                raise ValueError("drift requires a baseline (probe baseline save, then --baseline)")
+            self._baseline = Baseline.load(self._baseline_src)
+        return self._baseline
+
+    def prepare(self, inputs: list[str]) -> None:
+        base = self.baseline  # load (and memory-map) once, before probes start
+        comp = self._get_comparator()
+        expected = base.meta.get("embedding_model")
+        actual = getattr(comp, "_model_name", None)
+        if hasattr(comp, "encode") and expected and actual != expected:
+            raise ValueError(f"Baseline was embedded with '{expected}' but drift would score with "
+                             f"'{actual}'; use the same embedding model or rebuild the baseline")
+
+    def graph(self, input_text: str, provider: LLMProvider) -> ProbeGraph:
+        g = ProbeGraph()
+        g.add("output", lambda: provider.generate(input_text))
+
+        async def result(output) -> ProbeResult:
+            # Scored against the baseline by finalize(), together with the rest of the suite.
+            return ProbeResult(input=input_text, property_name=self.name,
+                               verdict=Verdict.ERROR, score=0.0, original_output=output,
+                               details={"pending": True})
+
+        g.add("result", result, deps=("output",))
+        return g
+
+    def finalize(self, results: list[ProbeResult]) -> None:
+        """Score every new answer against the baseline with one encode and one einsum."""
+        pending = [r for r in results if r.details.pop("pending", False)]
+        if not pending:
+            return
+        base = self.baseline
+        rows = base.rows([r.input for r in pending])
+        hit = rows >= 0
+        sims = np.zeros(len(pending))
+        if hit.any():
+            comp = self._get_comparator()
+            outputs = [r.original_output for r, h in zip(pending, hit) if h]
+            if hasattr(comp, "encode"):
+                sims[hit] = base.similarity(rows[hit], comp.encode(outputs))
+            else:
+                sims[hit] = [comp.similarity(base.outputs[row], o)
+                             for row, o in zip(rows[hit].tolist(), outputs)]
+
+        for r, row, sim in zip(pending, rows.tolist(), sims.tolist()):
+            if row < 0:
+                r.details["error"] = "Input not in baseline"
+                continue
+            r.verdict = Verdict.PASS if sim >= self.config.threshold else Verdict.FAIL
+            r.score = round(sim, 4)
+            r.variant_outputs = [base.outputs[row]]
+            r.details.update({"threshold": self.config.threshold,
+                              "similarity": round(sim, 4),
+                              "baseline_model": base.meta.get("model", "")})
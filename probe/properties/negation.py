@@ -1,7 +1,8 @@
-import time
+import asyncio
+from probe.core.graph import ProbeGraph
 from probe.core.properties import Property, PropertyConfig
 from probe.core.models import ProbeResult, Verdict
-from probe.core.transforms import NegationTransform
+from probe.core.transforms import NegationTransform, PackedTransform
 from probe.providers.base import LLMProvider
 
 
@@ -9,35 +10,45 @@ class NegationCoherence(Property):
     """Negate the question → answer should logically flip (low similarity = pass)."""
 
     name = "negation_coherence"
+    packable = True
 
-    def __init__(self, threshold: float = 0.7, comparator: str = "embedding"):
+    def __init__(self, threshold: float = 0.7, comparator: str = "embedding", pack_size: int = 1):
         super().__init__(PropertyConfig(threshold=threshold, comparator=comparator))
         self.transform = NegationTransform()
+        if pack_size > 1:
+            self.transform = PackedTransform(self.transform, pack_size=pack_size)
 
-    async def test(self, input_text: str, provider: LLMProvider) -> ProbeResult:
-        t0 = time.perf_counter()
+    def graph(self, input_text: str, provider: LLMProvider) -> ProbeGraph:
         comp = self._get_comparator()
-
-        original = await provider.generate(input_text)
-        negated_inputs = await self.transform.apply(input_text, provider)
-        if not negated_inputs:
-            return ProbeResult(input=input_text, property_name=self.name,
-                               verdict=Verdict.ERROR, score=0.0,
-                               details={"error": "Negation transform failed"})
-
-        negated_output = await provider.generate(negated_inputs[0])
-        sim = comp.similarity(original, negated_output)
-        divergence = 1.0 - sim
-        passed = divergence >= self.config.threshold
-
-        return ProbeResult(
-            input=input_text, property_name=self.name,
-            verdict=Verdict.PASS if passed else Verdict.FAIL,
-            score=round(divergence, 4), original_output=original,
-            variant_outputs=[negated_output],
-            elapsed_ms=(time.perf_counter() - t0) * 1000,
-            details={"threshold": self.config.threshold,
-                     "similarity": round(sim, 4),
-                     "divergence": round(divergence, 4),
-                     "negated_input": negated_inputs[0]},
-        )
+        g = ProbeGraph()
+        g.add("original", lambda: provider.generate(input_text))
+        g.add("negated", lambda: self.transform.apply(input_text, provider))
+
+        async def negated_output(negated_inputs):
+            return await provider.generate(negated_inputs[0]) if negated_inputs else None
+
+        g.add("negated_output", negated_output, deps=("negated",))
+
+        async def result(original, negated_inputs, negated_output) -> ProbeResult:
+            if not negated_inputs:
+                return ProbeResult(input=input_text, property_name=self.name,
+                                   verdict=Verdict.ERROR, score=0.0,
+                                   details={"error": "Negation transform failed"})
+            loop = asyncio.get_running_loop()
+            sim = await loop.run_in_executor(None, comp.similarity, original, negated_output)
+            divergence = 1.0 - sim
+            passed = divergence >= self.config.threshold
+
+            return ProbeResult(
+                input=input_text, property_name=self.name,
+                verdict=Verdict.PASS if passed else Verdict.FAIL,
+                score=round(divergence, 4), original_output=original,
+                variant_outputs=[negated_output],
+                details={"threshold": self.config.threshold,
+                         "similarity": round(sim, 4),
+                         "divergence": round(divergence, 4),
+                         "negated_input": negated_inputs[0]},
+            )
+
+        g.add("result", result, deps=("original", "negated", "negated_output"))
+        return g
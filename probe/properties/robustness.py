@@ -1,6 +1,8 @@
-import time
+from __future__ import annotations
+from probe.core.graph import ProbeGraph
 from probe.core.properties import Property, PropertyConfig
 from probe.core.models import ProbeResult, Verdict
+from probe.core.perturb import PerturbationConfig
 from probe.core.transforms import TypoTransform
 from probe.providers.base import LLMProvider
 
@@ -10,32 +12,35 @@ class Robustness(Property):
 
     name = "robustness"
 
-    def __init__(self, n_typos: int = 3, threshold: float = 0.85, comparator: str = "embedding"):
+    def __init__(self, n_typos: int = 3, threshold: float = 0.85, comparator: str = "embedding",
+                 seed: int = 0, perturbation: PerturbationConfig | None = None):
         super().__init__(PropertyConfig(threshold=threshold, comparator=comparator))
-        self.transform = TypoTransform(n=n_typos)
-
-    async def test(self, input_text: str, provider: LLMProvider) -> ProbeResult:
-        t0 = time.perf_counter()
-        comp = self._get_comparator()
-
-        original = await provider.generate(input_text)
-        typo_variants = await self.transform.apply(input_text)
-        variant_outputs = await provider.generate_batch(typo_variants)
-
-        scores = (comp.batch_similarity(original, variant_outputs)
-                  if hasattr(comp, "batch_similarity")
-                  else [comp.similarity(original, vo) for vo in variant_outputs])
-
-        avg = sum(scores) / len(scores) if scores else 0.0
-        passed = avg >= self.config.threshold
-
-        return ProbeResult(
-            input=input_text, property_name=self.name,
-            verdict=Verdict.PASS if passed else Verdict.FAIL,
-            score=round(avg, 4), original_output=original,
-            variant_outputs=variant_outputs,
-            elapsed_ms=(time.perf_counter() - t0) * 1000,
-            details={"threshold": self.config.threshold,
-                     "pairwise_scores": [round(s, 4) for s in scores],
-                     "typo_inputs": typo_variants},
-        )
+        self.transform = TypoTransform(n=n_typos, seed=seed, config=perturbation)
+
+    def prepare(self, inputs: list[str]) -> None:
+        self.transform.prepare(inputs)
+
+    def graph(self, input_text: str, provider: LLMProvider) -> ProbeGraph:
+        g = ProbeGraph()
+        g.add("original", lambda: provider.generate(input_text))
+        g.add("variants", lambda: self.transform.apply(input_text))
+        g.add("scored", self._variant_scores(g, provider), deps=("variants",), soft=("original",))
+
+        async def result(original, typo_variants, scored) -> ProbeResult:
+            variant_outputs, scores = scored or ([], [])
+            avg = sum(scores) / len(scores) if scores else 0.0
+            passed = avg >= self.config.threshold
+
+            return ProbeResult(
+                input=input_text, property_name=self.name,
+                verdict=Verdict.PASS if passed else Verdict.FAIL,
+                score=round(avg, 4), original_output=original,
+                variant_outputs=variant_outputs,
+                details={"threshold": self.config.threshold,
+                         "pairwise_scores": [round(s, 4) for s in scores],
+                         "seed": self.transform.seed,
+                         "typo_inputs": typo_variants},
+            )
+
+        g.add("result", result, deps=("original", "variants", "scored"))
+        return g
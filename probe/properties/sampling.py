@@ -0,0 +1,59 @@
+import asyncio
+from itertools import combinations
+from probe.core.graph import ProbeGraph
+from probe.core.properties import Property, PropertyConfig
+from probe.core.models import ProbeResult, Verdict
+from probe.providers.base import LLMProvider
+
+
+class SamplingStability(Property):
+    """Sample the same input N times at temperature > 0 → samples should agree."""
+
+    name = "sampling_stability"
+
+    def __init__(self, n_samples: int = 5, temperature: float = 0.7, threshold: float = 0.8,
+                 comparator: str = "embedding"):
+        super().__init__(PropertyConfig(threshold=threshold, comparator=comparator))
+        self.n_samples = n_samples
+        self.temperature = temperature
+
+    def _pairwise(self, samples: list[str]) -> list[float]:
+        comp = self._get_comparator()
+        if hasattr(comp, "pairwise_similarity"):
+            return comp.pairwise_similarity(samples)
+        return [comp.similarity(a, b) for a, b in combinations(samples, 2)]
+
+    def graph(self, input_text: str, provider: LLMProvider) -> ProbeGraph:
+        g = ProbeGraph()
+        g.add("samples", lambda: provider.generate_samples(input_text, self.n_samples,
+                                                           self.temperature))
+
+        async def scored(samples: list[str]) -> list[float]:
+            if len(samples) < 2:
+                return []
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._pairwise, samples)
+
+        g.add("scored", scored, deps=("samples",))
+
+        async def result(samples, scores) -> ProbeResult:
+            if len(samples) < 2:
+                return ProbeResult(input=input_text, property_name=self.name,
+                                   verdict=Verdict.ERROR, score=0.0,
+                                   details={"error": "Fewer than 2 samples generated"})
+            avg = sum(scores) / len(scores)
+            passed = avg >= self.config.threshold
+
+            return ProbeResult(
+                input=input_text, property_name=self.name,
+                verdict=Verdict.PASS if passed else Verdict.FAIL,
+                score=round(avg, 4), original_output=samples[0],
+                variant_outputs=samples[1:],
+                details={"threshold": self.config.threshold,
+                         "temperature": self.temperature,
+                         "pairwise_scores": [round(s, 4) for s in scores],
+                         "min_score": round(min(scores), 4)},
+            )
+
+        g.add("result", result, deps=("samples", "scored"))
+        return g
@@ -2,9 +2,31 @@ from probe.providers.base import LLMProvider
 from probe.providers.openai import OpenAIProvider
 from probe.providers.anthropic import AnthropicProvider
 from probe.providers.ollama import OllamaProvider
+from probe.providers.hedged import HedgedProvider
+from probe.providers.local import LocalProvider
+
+
+def _parse_options(query: str) -> dict:
+    opts = {}
+    for pair in filter(None, query.split("&")):
+        key, _, value = pair.partition("=")
+        for cast in (int, float):
+            try:
+                value = cast(value)
+                break
+            except ValueError:
+                continue
+        opts[key] = value
+    return opts
 
 
 def get_provider(provider_str: str, **kwargs) -> LLMProvider:
+    """Build a provider from ``backend:model``, with optional ``?key=value&...`` options.
+
+    e.g. ``ollama:llama3?keep_alive=30m&num_ctx=8192&parallel=8``.
+    """
+    provider_str, _, query = provider_str.partition("?")
+    kwargs = {**_parse_options(query), **kwargs}
     parts = provider_str.split(":", 1)
     backend = parts[0].lower()
     model = parts[1] if len(parts) > 1 else None
@@ -15,5 +37,7 @@ def get_provider(provider_str: str, **kwargs) -> LLMProvider:
         return AnthropicProvider(model=model or "claude-sonnet-4-20250514", **kwargs)
     elif backend == "ollama":
         return OllamaProvider(model=model or "llama3", **kwargs)
+    elif backend == "local":
+        return LocalProvider(model=model or "Qwen/Qwen2.5-0.5B-Instruct", **kwargs)
     else:
-        raise ValueError(f"Unknown provider: {backend}. Use openai, anthropic, or ollama.")
+        raise ValueError(f"Unknown provider: {backend}. Use openai, anthropic, ollama, or local.")
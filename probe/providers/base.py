@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -11,3 +12,17 @@ class LLMProvider(ABC):
     @abstractmethod
     async def generate_batch(self, prompts: list[str], temperature: float = 0.0) -> list[str]:
         ...
+
+    async def generate_samples(self, prompt: str, n: int, temperature: float = 0.7) -> list[str]:
+        """Sample ``prompt`` ``n`` times; backends with native multi-choice override this."""
+        return list(await asyncio.gather(*[self.generate(prompt, temperature) for _ in range(n)]))
+
+    async def warmup(self) -> None:
+        """Prepare the backend (load models, open connections) before a suite runs."""
+
+    async def aclose(self) -> None:
+        """Release pooled clients."""
+
+    def stats(self) -> dict:
+        """Counters reported in ``SuiteResult.stats`` after a run."""
+        return {}
@@ -0,0 +1,129 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+
+import numpy as np
+
+from probe.providers.base import LLMProvider
+
+
+class HedgedProvider(LLMProvider):
+    """Wraps a provider with per-call deadlines and optional request hedging.
+
+    With ``hedge`` on, a call still running after the observed ``hedge_quantile`` latency of
+    this provider gets a duplicate; the first successful response wins and the other is
+    cancelled. Hedging starts once ``min_samples`` latencies have been observed.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        deadline: float | None = None,
+        hedge: bool = True,
+        hedge_quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 500,
+    ):
+        self.inner = inner
+        self.model_name = inner.model_name
+        self.deadline = deadline
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.wasted = 0
+        self.timeouts = 0
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or ``None`` while there is too little data."""
+        if not self.hedge or len(self._latencies) < self.min_samples:
+            return None
+        return float(np.quantile(np.fromiter(self._latencies, dtype=float), self.hedge_quantile))
+
+    def _start(self, prompt: str, temperature: float) -> asyncio.Task:
+        t0 = time.perf_counter()
+        task = asyncio.ensure_future(self.inner.generate(prompt, temperature))
+
+        def record(t: asyncio.Task):
+            if not t.cancelled() and t.exception() is None:
+                self._latencies.append(time.perf_counter() - t0)
+
+        task.add_done_callback(record)
+        return task
+
+    async def _race(self, prompt: str, temperature: float) -> str:
+        first = self._start(prompt, temperature)
+        tasks = [first]
+        winner = None
+        try:
+            delay = self.hedge_delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    self.hedges += 1
+                    tasks.append(self._start(prompt, temperature))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                ok = [t for t in tasks if t in done and t.exception() is None]
+                if ok or not pending:
+                    winner = ok[0] if ok else next(t for t in tasks if t in done)
+                    break
+            if winner is not first:
+                self.hedge_wins += 1
+            return winner.result()
+        finally:
+            for t in tasks:
+                if t is winner:
+                    continue
+                if not t.done():
+                    t.cancel()
+                if len(tasks) > 1:
+                    self.wasted += 1
+
+    async def generate(self, prompt: str, temperature: float = 0.0) -> str:
+        self.calls += 1
+        if self.deadline is None:
+            return await self._race(prompt, temperature)
+        try:
+            return await asyncio.wait_for(self._race(prompt, temperature), self.deadline)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise TimeoutError(f"Call exceeded {self.deadline}s deadline") from None
+
+    async def generate_batch(self, prompts: list[str], temperature: float = 0.0) -> list[str]:
+        return list(await asyncio.gather(*[self.generate(p, temperature) for p in prompts]))
+
+    async def generate_samples(self, prompt: str, n: int, temperature: float = 0.7) -> list[str]:
+        self.calls += 1
+        coro = self.inner.generate_samples(prompt, n, temperature)
+        if self.deadline is None:
+            return await coro
+        try:
+            return await asyncio.wait_for(coro, self.deadline)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise TimeoutError(f"Call exceeded {self.deadline}s deadline") from None
+
+    async def warmup(self) -> None:
+        await self.inner.warmup()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def stats(self) -> dict:
+        delay = self.hedge_delay()
+        return {
+            **self.inner.stats(),
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "wasted_calls": self.wasted,
+            "hedge_rate": round(self.hedges / self.calls, 4) if self.calls else 0.0,
+            "hedge_after_ms": round(delay * 1000, 1) if delay is not None else None,
+        }
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from probe.core.hashing import input_hash
+from probe.providers.base import LLMProvider
+
+
+class LocalProvider(LLMProvider):
+    """In-process Hugging Face causal LM on CPU, with dynamic request batching.
+
+    Concurrent ``generate`` calls are queued and merged into left-padded batches of up to
+    ``max_batch_size`` prompts, waiting at most ``max_wait_ms`` for a batch to fill. Generation
+    runs on a dedicated worker thread so the event loop stays responsive.
+
+    Sampling (``temperature > 0``) is seeded per prompt from ``seed`` and the prompt's hash and
+    runs one prompt at a time, so sampled outputs are reproducible whatever the batch they land in.
+    """
+
+    def __init__(
+        self,
+        model: str = "Qwen/Qwen2.5-0.5B-Instruct",
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        max_new_tokens: int = 256,
+        device: str = "cpu",
+        seed: int = 0,
+    ):
+        self.model_name = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_new_tokens = max_new_tokens
+        self._device = device
+        self._seed = seed
+        self._model = None
+        self._tokenizer = None
+        self._load_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.batches = 0
+        self.batched_prompts = 0
+
+    # -- model (worker thread) --------------------------------------------
+
+    def _load(self):
+        with self._load_lock:
+            if self._model is not None:
+                return
+            try:
+                import torch  # noqa: F401
+                from transformers import AutoModelForCausalLM, AutoTokenizer
+            except ImportError:
+                raise ImportError("Install transformers and torch: pip install probe-llm[local]")
+            tok = AutoTokenizer.from_pretrained(self.model_name)
+            tok.padding_side = "left"
+            if tok.pad_token is None:
+                tok.pad_token = tok.eos_token
+            model = AutoModelForCausalLM.from_pretrained(self.model_name)
+            model.to(self._device).eval()
+            self._tokenizer, self._model = tok, model
+
+    def _format(self, prompt: str) -> str:
+        tok = self._tokenizer
+        if getattr(tok, "chat_template", None):
+            return tok.apply_chat_template([{"role": "user", "content": prompt}],
+                                           tokenize=False, add_generation_prompt=True)
+        return prompt
+
+    def _generate_sync(self, prompts: list[str], temperature: float,
+                       num_return_sequences: int = 1) -> list[str]:
+        self._load()  # first, so a missing torch/transformers gets the install hint
+        import torch
+        sample = temperature > 0
+        if sample and len(prompts) > 1:
+            # generate() draws from one global RNG, so a shared batch can't be seeded per prompt.
+            return [text for p in prompts
+                    for text in self._generate_sync([p], temperature, num_return_sequences)]
+        tok = self._tokenizer
+        enc = tok([self._format(p) for p in prompts], return_tensors="pt", padding=True)
+        enc = enc.to(self._device)
+        # Seed a forked torch RNG; the process-wide RNG state is never reseeded from here.
+        devices = [] if self._device == "cpu" else None
+        with torch.random.fork_rng(devices=devices), torch.inference_mode():
+            if sample:
+                torch.manual_seed((self._seed ^ input_hash(prompts[0])) % (1 << 63))
+            out = self._model.generate(
+                **enc,
+                max_new_tokens=self.max_new_tokens,
+                do_sample=sample,
+                temperature=temperature if sample else None,
+                top_p=None if not sample else 1.0,
+                num_return_sequences=num_return_sequences,
+                pad_token_id=tok.pad_token_id,
+            )
+        new_tokens = out[:, enc["input_ids"].shape[1]:]
+        return [t.strip() for t in tok.batch_decode(new_tokens, skip_special_tokens=True)]
+
+    # -- batching (event loop) --------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Recreated after aclose(), so a closed provider can still be reused.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe-local")
+        return self._executor
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._loop is not loop or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._worker = loop.create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            by_temp: dict[float, list] = {}
+            for item in batch:
+                by_temp.setdefault(item[1], []).append(item)
+            for temperature, items in by_temp.items():
+                items = [it for it in items if not it[2].done()]
+                if not items:
+                    continue
+                self.batches += 1
+                self.batched_prompts += len(items)
+                try:
+                    outs = await loop.run_in_executor(self._get_executor(), self._generate_sync,
+                                                      [p for p, _, _ in items], temperature)
+                except Exception as e:
+                    for _, _, fut in items:
+                        if not fut.done():
+                            fut.set_exception(e)
+                    continue
+                for (_, _, fut), text in zip(items, outs):
+                    if not fut.done():
+                        fut.set_result(text)
+
+    async def generate(self, prompt: str, temperature: float = 0.0) -> str:
+        self._ensure_worker()
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, temperature, fut))
+        return await fut
+
+    async def generate_batch(self, prompts: list[str], temperature: float = 0.0) -> list[str]:
+        return list(await asyncio.gather(*[self.generate(p, temperature) for p in prompts]))
+
+    async def generate_samples(self, prompt: str, n: int, temperature: float = 0.7) -> list[str]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self._generate_sync, [prompt],
+                                          temperature, n)
+
+    async def warmup(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._get_executor(), self._load)
+
+    async def aclose(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict:
+        avg = self.batched_prompts / self.batches if self.batches else 0.0
+        return {"batches": self.batches, "avg_batch_size": round(avg, 2)}
@@ -1,29 +1,87 @@
 from __future__ import annotations
+import asyncio
 import httpx
 from probe.providers.base import LLMProvider
 
 
 class OllamaProvider(LLMProvider):
-    def __init__(self, model: str = "llama3", base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str = "llama3",
+        base_url: str = "http://localhost:11434",
+        keep_alive: str | int | None = "10m",
+        num_ctx: int | None = None,
+        parallel: int = 4,
+        max_connections: int = 8,
+        timeout: float = 120.0,
+    ):
         self.model_name = model
         self._base_url = base_url
+        self._keep_alive = keep_alive
+        self._num_ctx = num_ctx
+        self._parallel = parallel
+        self._limits = httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_connections)
+        self._timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._sem: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: asyncio.Future | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # httpx clients and semaphores are bound to the loop they were first used on.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                self._close_stale(self._client, self._loop)
+            self._client = httpx.AsyncClient(base_url=self._base_url, timeout=self._timeout,
+                                             limits=self._limits)
+            self._sem = asyncio.Semaphore(self._parallel)
+            self._loop = loop
+        return self._client
+
+    def _close_stale(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a client left behind on another loop, on that loop if it is still running."""
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+
+        async def close() -> None:
+            try:
+                await client.aclose()
+            except Exception:
+                pass  # its connections belonged to a loop that is gone
+        self._closing = asyncio.ensure_future(close())
+
+    def _payload(self, prompt: str, temperature: float) -> dict:
+        options: dict = {"temperature": temperature}
+        if self._num_ctx is not None:
+            options["num_ctx"] = self._num_ctx
+        payload = {"model": self.model_name, "prompt": prompt, "stream": False, "options": options}
+        if self._keep_alive is not None:
+            payload["keep_alive"] = self._keep_alive
+        return payload
 
     async def generate(self, prompt: str, temperature: float = 0.0) -> str:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(
-                f"{self._base_url}/api/generate",
-                json={
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {"temperature": temperature},
-                },
-            )
-            resp.raise_for_status()
-            return resp.json().get("response", "")
+        client = self._get_client()
+        async with self._sem:
+            resp = await client.post("/api/generate", json=self._payload(prompt, temperature))
+        resp.raise_for_status()
+        return resp.json().get("response", "")
 
     async def generate_batch(self, prompts: list[str], temperature: float = 0.0) -> list[str]:
-        results = []
-        for p in prompts:
-            results.append(await self.generate(p, temperature))
-        return results
+        return list(await asyncio.gather(*[self.generate(p, temperature) for p in prompts]))
+
+    async def warmup(self) -> None:
+        """Load the model into memory (an empty prompt only loads it) before the suite starts.
+
+        Uses the same options as real requests, so a custom ``num_ctx`` doesn't force a reload.
+        """
+        client = self._get_client()
+        resp = await client.post("/api/generate", json=self._payload("", 0.0))
+        resp.raise_for_status()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
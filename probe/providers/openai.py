@@ -29,5 +29,16 @@ class OpenAIProvider(LLMProvider):
         )
         return resp.choices[0].message.content or ""
 
+    async def generate_samples(self, prompt: str, n: int, temperature: float = 0.7) -> list[str]:
+        client = self._get_client()
+        resp = await client.chat.completions.create(
+            model=self.model_name,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=1024,
+            n=n,
+        )
+        return [c.message.content or "" for c in sorted(resp.choices, key=lambda c: c.index)]
+
     async def generate_batch(self, prompts: list[str], temperature: float = 0.0) -> list[str]:
         return await asyncio.gather(*[self.generate(p, temperature) for p in prompts])
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from probe.core.columnar import diff_runs, export_columnar, load_columnar  # noqa: E402
+from probe.core.models import ProbeResult, SuiteResult, Verdict  # noqa: E402
+from probe.core.store import ResultStore  # noqa: E402
+
+
+def _suite(rows, model="m"):
+    store = ResultStore()
+    for inp, prop, verdict, score in rows:
+        store.append(ProbeResult(inp, prop, verdict, score, details={"threshold": 0.8},
+                                 original_output=f"out {inp}", variant_outputs=[f"v {inp}"]),
+                     weight=2.0)
+    return SuiteResult(model_name=model, total_elapsed_ms=12.5, store=store)
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trip(tmp_path, suffix):
+    suite = _suite([("a", "consistency", Verdict.PASS, 0.9),
+                    ("b", "robustness", Verdict.FAIL, 0.3)])
+    path = str(tmp_path / f"run{suffix}")
+    export_columnar(suite, path)
+    loaded = load_columnar(path)
+
+    assert loaded.model_name == "m" and loaded.total_elapsed_ms == 12.5
+    assert list(loaded.results) == list(suite.results)
+    assert loaded.store.weights.tolist() == [2.0, 2.0]
+
+
+def test_diff_finds_regressions_fixes_and_missing_rows(tmp_path):
+    a = _suite([("x", "consistency", Verdict.PASS, 0.9),
+                ("y", "consistency", Verdict.FAIL, 0.4),
+                ("z", "consistency", Verdict.PASS, 0.8)])
+    b = _suite([("x", "consistency", Verdict.FAIL, 0.5),
+                ("y", "consistency", Verdict.PASS, 0.95)])
+    export_columnar(a, str(tmp_path / "a.parquet"))
+    export_columnar(b, str(tmp_path / "b.arrow"))
+
+    d = diff_runs(str(tmp_path / "a.parquet"), str(tmp_path / "b.arrow"))
+    assert d.matched == 2
+    assert (d.only_in_a, d.only_in_b) == (1, 0)
+    assert int(d.regressions.sum()) == 1 and int(d.fixes.sum()) == 1
+    worst = d.worst(1)[0]
+    assert d.delta[worst] == pytest.approx(-0.4)
+    assert d.by_property() == [{"property": "consistency", "matched": 2, "regressions": 1,
+                                "fixes": 1, "mean_delta": pytest.approx(0.075)}]
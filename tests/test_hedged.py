@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from probe.providers.base import LLMProvider
+from probe.providers.hedged import HedgedProvider
+
+
+class Scripted(LLMProvider):
+    """Answers call ``i`` after ``delays[i]`` seconds, and records cancellations."""
+
+    model_name = "scripted"
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.started = 0
+        self.cancelled = []
+
+    async def generate(self, prompt, temperature=0.0):
+        i = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delays[i])
+        except asyncio.CancelledError:
+            self.cancelled.append(i)
+            raise
+        return f"answer {i}"
+
+    async def generate_batch(self, prompts, temperature=0.0):
+        return [await self.generate(p, temperature) for p in prompts]
+
+
+def test_no_hedge_before_min_samples():
+    inner = Scripted([0.0, 0.0, 0.05])
+    hedged = HedgedProvider(inner, hedge=True, min_samples=3)
+
+    async def main():
+        for _ in range(3):
+            await hedged.generate("q")
+
+    asyncio.run(main())
+    assert inner.started == 3
+    assert hedged.hedges == 0
+    assert hedged.hedge_delay() is not None
+
+
+def test_hedge_wins_and_slow_call_is_cancelled():
+    inner = Scripted([0.0, 0.0, 1.0, 0.0])
+    hedged = HedgedProvider(inner, hedge=True, min_samples=2)
+
+    async def main():
+        await hedged.generate("q")
+        await hedged.generate("q")
+        return await hedged.generate("q")
+
+    assert asyncio.run(main()) == "answer 3"
+    assert inner.cancelled == [2]
+    assert (hedged.hedges, hedged.hedge_wins, hedged.wasted) == (1, 1, 1)
+
+
+def test_original_wins_and_hedge_is_wasted():
+    inner = Scripted([0.01, 0.01, 0.1, 1.0])
+    hedged = HedgedProvider(inner, hedge=True, min_samples=2)
+
+    async def main():
+        await hedged.generate("q")
+        await hedged.generate("q")
+        return await hedged.generate("q")
+
+    assert asyncio.run(main()) == "answer 2"
+    assert inner.cancelled == [3]
+    assert (hedged.hedges, hedged.hedge_wins, hedged.wasted) == (1, 0, 1)
+
+
+def test_deadline_raises_and_cancels_both_calls():
+    inner = Scripted([0.0, 0.0, 1.0, 1.0])
+    hedged = HedgedProvider(inner, deadline=0.1, hedge=True, min_samples=2)
+
+    async def main():
+        await hedged.generate("q")
+        await hedged.generate("q")
+        with pytest.raises(TimeoutError):
+            await hedged.generate("q")
+
+    asyncio.run(main())
+    assert sorted(inner.cancelled) == [2, 3]
+    assert hedged.timeouts == 1
+    assert hedged.stats()["calls"] == 3
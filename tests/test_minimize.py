@@ -0,0 +1,18 @@
+import numpy as np
+
+from probe.core.minimize import cluster_embeddings, minimize_inputs
+
+
+def test_clusters_near_duplicates():
+    embs = np.array([[1, 0], [0.99, 0.14], [0, 1]], dtype=np.float32)
+    embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+    clustering = cluster_embeddings(embs, threshold=0.9, block_size=2)
+    assert clustering.labels.tolist() == [0, 0, 1]
+    assert clustering.representatives.tolist() == [0, 2]
+    assert clustering.weights.tolist() == [2, 1]
+
+
+def test_empty_inputs():
+    assert cluster_embeddings(np.empty((0, 4))).n_clusters == 0
+    reps, sizes, clustering = minimize_inputs([])
+    assert reps == [] and sizes == [] and clustering.n_clusters == 0
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from probe.core.perturb import PerturbationConfig, PerturbationEngine
+from probe.core.transforms import TypoTransform
+
+TEXTS = [
+    "What is the capital of France?",
+    "Summarize the following paragraph in one sentence.",
+    "aaaa",
+    "hello",
+    "Translate 'good morning' into Spanish.",
+]
+
+
+def test_same_seed_is_byte_identical():
+    a = PerturbationEngine(seed=7).perturb_many(TEXTS, n=4)
+    b = PerturbationEngine(seed=7).perturb_many(TEXTS, n=4)
+    assert a == b
+
+
+def test_variants_do_not_depend_on_batch():
+    engine = PerturbationEngine(seed=7)
+    batched = engine.perturb_many(TEXTS, n=3)
+    single = [engine.perturb_many([t], n=3)[0] for t in TEXTS]
+    reversed_ = engine.perturb_many(TEXTS[::-1], n=3)[::-1]
+    assert batched == single == reversed_
+
+
+def test_different_seed_differs():
+    assert PerturbationEngine(seed=1).perturb_many(TEXTS, n=3) != \
+        PerturbationEngine(seed=2).perturb_many(TEXTS, n=3)
+
+
+def test_every_variant_of_a_long_enough_text_is_edited():
+    for seed in range(20):
+        out = PerturbationEngine(seed=seed).perturb_many(TEXTS + ["bbbbbbbb", "éééé"], n=3)
+        for text, variants in zip(TEXTS + ["bbbbbbbb", "éééé"], out):
+            assert all(v != text for v in variants), (seed, text, variants)
+
+
+def test_short_and_empty_texts_pass_through():
+    engine = PerturbationEngine(seed=0)
+    assert engine.perturb_many([], n=3) == []
+    assert engine.perturb_many([""], n=2) == [["", ""]]
+    assert engine.perturb_many(["", "abc", ""], n=2) == [["", ""], ["abc", "abc"], ["", ""]]
+    assert asyncio.run(TypoTransform().apply("")) == ["", "", ""]
+
+
+def test_config_rejects_invalid_rates():
+    with pytest.raises(ValueError):
+        PerturbationConfig(substitute=0.6, delete=0.5)
+    with pytest.raises(ValueError):
+        PerturbationConfig(swap=-0.1)
+    PerturbationConfig(substitute=0.5, delete=0.5, insert=0, case=0, whitespace=0, swap=0)
@@ -0,0 +1,67 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from probe.core.graph import ProbeGraph
+from probe.core.properties import Property
+from probe.providers.base import LLMProvider
+
+
+class StubEmbedding:
+    _model_name = "stub"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size=256):
+        self.encoded.extend(texts)
+        v = np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+        return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+class SlowEcho(LLMProvider):
+    """Answers with the prompt itself, slower for earlier prompts."""
+
+    model_name = "echo"
+
+    async def generate(self, prompt, temperature=0.0):
+        await asyncio.sleep(0.01 * (5 - len(prompt)))
+        return prompt
+
+    async def generate_batch(self, prompts, temperature=0.0):
+        return [await self.generate(p) for p in prompts]
+
+
+class Scored(Property):
+    name = "scored"
+
+    def graph(self, input_text, provider):
+        g = ProbeGraph()
+        g.add("original", lambda: provider.generate(input_text))
+        g.add("variants", lambda: asyncio.sleep(0, ["a", "bb", "ccc"]))
+        g.add("result", self._variant_scores(g, provider), deps=("variants",),
+              soft=("original",))
+        return g
+
+
+def test_property_needs_graph_or_test():
+    class OnlyTest(Property):
+        async def test(self, input_text, provider):
+            return None
+
+    OnlyTest()
+    with pytest.raises(TypeError):
+        class Neither(Property):
+            pass
+
+
+def test_variant_scores_keep_prompt_order_and_embed_original_once():
+    prop = Scored()
+    comp = StubEmbedding()
+    prop.set_comparator(comp)
+    outputs, scores = asyncio.run(prop.graph("dd", SlowEcho()).run())
+    assert outputs == ["a", "bb", "ccc"]
+    assert scores[1] == pytest.approx(1.0)
+    assert scores[0] < 1.0 and scores[2] < 1.0
+    assert comp.encoded.count("dd") == 1
@@ -0,0 +1,17 @@
+import pytest
+
+from probe.core.models import ProbeResult, SuiteResult, Verdict
+from probe.core.reporter import property_aggregates
+from probe.core.store import ResultStore
+
+
+def test_property_aggregates_are_weighted_like_the_suite():
+    store = ResultStore()
+    store.append(ProbeResult("a", "consistency", Verdict.PASS, 1.0), weight=9.0)
+    store.append(ProbeResult("b", "consistency", Verdict.FAIL, 0.0), weight=1.0)
+    suite = SuiteResult(store=store)
+
+    [agg] = property_aggregates(suite)
+    assert agg["total"] == 2 and agg["passed"] == 1
+    assert agg["pass_rate"] == pytest.approx(suite.pass_rate) == pytest.approx(0.9)
+    assert agg["mean_score"] == pytest.approx(0.9)
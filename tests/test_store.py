@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+from probe.core.models import ProbeResult, SuiteResult, Verdict
+from probe.core.store import ResultStore
+
+
+def _result(inp, verdict, score, prop="consistency"):
+    return ProbeResult(inp, prop, verdict, score, details={"threshold": 0.8, "rephrasings": [inp]},
+                       original_output=f"out {inp}", variant_outputs=[f"v1 {inp}", f"v2 {inp}"])
+
+
+def test_counters_and_weights_are_incremental():
+    store = ResultStore()
+    store.append(_result("a", Verdict.PASS, 0.9), weight=3.0)
+    store.append(_result("b", Verdict.FAIL, 0.2), weight=1.0)
+    store.append(_result("c", Verdict.ERROR, 0.0, prop="robustness"))
+    suite = SuiteResult(store=store)
+
+    assert (suite.total, suite.passed, suite.failed, suite.errors) == (3, 1, 1, 1)
+    assert store.total_weight == 5.0 and store.passed_weight == 3.0
+    assert suite.pass_rate == pytest.approx(0.6)
+    assert store.mask_for_property("robustness").tolist() == [False, False, True]
+
+
+def test_retain_failures_drops_passing_texts():
+    store = ResultStore(retain="failures")
+    store.append(_result("a", Verdict.PASS, 0.9))
+    store.append(_result("b", Verdict.FAIL, 0.2))
+
+    passed, failed = store.row(0), store.row(1)
+    assert passed.input == "a" and passed.original_output == "" and passed.variant_outputs == []
+    assert passed.details == {"threshold": 0.8}
+    assert failed == _result("b", Verdict.FAIL, 0.2)
+
+
+def test_spilled_rows_read_back_and_file_is_removed(tmp_path):
+    store = ResultStore(spill_dir=str(tmp_path))
+    results = [_result(f"input {i}", Verdict.PASS if i % 2 else Verdict.FAIL, i / 10)
+               for i in range(5)]
+    for r in results:
+        store.append(r)
+    assert store.texts.spilled and len(os.listdir(tmp_path)) == 1
+
+    with SuiteResult(store=store) as suite:
+        assert list(suite.results) == results
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,17 @@
+from probe.core.transforms import PackedTransform, ParaphraseTransform
+
+
+def _parse(raw, k=3):
+    return PackedTransform(ParaphraseTransform(n=2), pack_size=k)._parse(raw, k)
+
+
+def test_parse_ignores_brackets_in_prose_and_fences():
+    expected = [["a", "b"], ["c"], ["d"]]
+    assert _parse('[["a","b"],["c"],["d"]] note [1]') == expected
+    assert _parse('Sure [see below]:\n```json\n[["a","b"],["c"],["d"]]\n```') == expected
+
+
+def test_parse_falls_back_per_item():
+    assert _parse('[["a"], 3, []]') == [["a"], None, None]
+    assert _parse("no json here") == [None, None, None]
+    assert _parse('[["a"], ["b"]]') == [None, None, None]